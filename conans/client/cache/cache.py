@@ -8,6 +8,7 @@ from jinja2 import Environment, select_autoescape
 
 from conans.assets.templates import dict_loader
 from conans.client.cache.editable import EditablePackages
+from conans.client.cache.range_index import RangeResolutionIndex
 from conans.client.cache.remote_registry import RemoteRegistry
 from conans.client.conf import ConanClientConfigParser, get_default_client_conf, \
     get_default_settings_yml
@@ -79,9 +80,22 @@ class ClientCache(object):
         # Just call it to make it raise in case of short_paths misconfiguration
         self.config.short_paths_home
 
-    def all_refs(self):
-        subdirs = list_folder_subdirs(basedir=self._store_folder, level=4)
-        return [ConanFileReference.load_dir_repr(folder) for folder in subdirs]
+    def all_refs(self, name=None):
+        """ all the references in the store, or only the ones with the given name, (case
+        insensitive, as searches), walking only the folders of that name
+        """
+        if name is None:
+            subdirs = list_folder_subdirs(basedir=self._store_folder, level=4)
+            return [ConanFileReference.load_dir_repr(folder) for folder in subdirs]
+        if not os.path.isdir(self._store_folder):
+            return []
+        refs = []
+        for folder in os.listdir(self._store_folder):
+            if folder.lower() == name.lower():
+                subdirs = list_folder_subdirs(basedir=join(self._store_folder, folder), level=3)
+                refs.extend(ConanFileReference.load_dir_repr("%s/%s" % (folder, subdir))
+                            for subdir in subdirs)
+        return refs
 
     @property
     def store(self):
@@ -94,6 +108,11 @@ class ClientCache(object):
     def config_install_file(self):
         return os.path.join(self.cache_folder, "config_install.json")
 
+    @property
+    def bytecode_folder(self):
+        """ compiled recipes, not to compile them every time they are loaded """
+        return os.path.join(self.cache_folder, "bytecode")
+
     def package_layout(self, ref, short_paths=None):
         assert isinstance(ref, ConanFileReference), "It is a {}".format(type(ref))
         edited_ref = self.editable_packages.get(ref.copy_clear_rev())
@@ -115,6 +134,10 @@ class ClientCache(object):
     def registry(self):
         return RemoteRegistry(self, self._output)
 
+    @property
+    def range_index(self):
+        return RangeResolutionIndex(self.cache_folder, self.config.version_ranges_ttl)
+
     def _no_locks(self):
         if self._no_lock is None:
             self._no_lock = self.config.cache_no_locks
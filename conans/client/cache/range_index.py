@@ -0,0 +1,57 @@
+import json
+import os
+import time
+from os.path import join, normpath
+
+from conans.model.ref import ConanFileReference
+from conans.util.files import load, save
+
+
+RANGE_INDEX_FILE = 'version_ranges.json'
+
+
+class RangeResolutionIndex(object):
+    """ Persistent listing of the recipe references found in the remotes for every recipe name,
+    used to resolve version ranges without searching again the remotes while the listing is
+    younger than the configured 'general.version_ranges_ttl'
+    """
+    def __init__(self, cache_folder, ttl):
+        self._index_file = normpath(join(cache_folder, RANGE_INDEX_FILE))
+        self._ttl = ttl.total_seconds() if ttl else None
+        self._index = None  # {name: {remote_url: {"time": timestamp, "refs": [str(ref)]}}}
+
+    def _load(self):
+        if self._index is None:
+            try:
+                self._index = json.loads(load(self._index_file))
+            except (IOError, OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save(self):
+        save(self._index_file, json.dumps(self._index))
+
+    def get(self, remote, name):
+        """ the references of 'name' in the remote, or None if not listed or expired
+        """
+        if not self._ttl:
+            return None
+        entry = self._load().get(name, {}).get(remote.url)
+        if entry is None or time.time() - entry["time"] > self._ttl:
+            return None
+        return [ConanFileReference.loads(r, validate=False) for r in entry["refs"]]
+
+    def set(self, remote, name, refs):
+        if not self._ttl:
+            return
+        listing = {"time": time.time(), "refs": [repr(ref) for ref in refs]}
+        self._load().setdefault(name, {})[remote.url] = listing
+        self._save()
+
+    def invalidate(self, ref):
+        """ A recipe has been exported, uploaded or removed, its versions need to be listed again
+        """
+        if not os.path.exists(self._index_file):
+            return
+        if self._load().pop(ref.name, None) is not None:
+            self._save()
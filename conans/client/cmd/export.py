@@ -33,7 +33,8 @@ class AliasConanfile(ConanFile):
 """ % (target_ref.full_str(), revision_mode)
 
     save(package_layout.conanfile(), conanfile)
-    manifest = FileTreeManifest.create(package_layout.export())
+    manifest = FileTreeManifest.create(package_layout.export(),
+                                       hash_cache=package_layout.recipe_hashes())
     manifest.save(folder=package_layout.export())
 
     # Create the metadata for the alias
@@ -152,7 +153,8 @@ def cmd_export(app, conanfile_path, name, version, user, channel, keep_source,
                              conanfile_path=package_layout.conanfile())
 
         # Compute the new digest
-        manifest = FileTreeManifest.create(package_layout.export(), package_layout.export_sources())
+        manifest = FileTreeManifest.create(package_layout.export(), package_layout.export_sources(),
+                                           hash_cache=package_layout.recipe_hashes())
         modified_recipe |= not previous_manifest or previous_manifest != manifest
         if modified_recipe:
             output.success('A new %s version was exported' % CONANFILE)
@@ -201,6 +203,7 @@ def cmd_export(app, conanfile_path, name, version, user, channel, keep_source,
 
     ref = ref.copy_with_rev(revision)
     output.info("Exported revision: %s" % revision)
+    cache.range_index.invalidate(ref)
     if graph_lock:
         graph_lock.update_exported_ref(node_id, ref)
     return ref
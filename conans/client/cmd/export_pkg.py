@@ -60,11 +60,13 @@ def export_pkg(app, recorder, full_ref, source_folder, build_folder, package_fol
     with set_dirty_context_manager(dest_package_folder):
         if package_folder:
             prev = packager.export_pkg(conanfile, package_id, package_folder, dest_package_folder,
-                                       hook_manager, conan_file_path, ref)
+                                       hook_manager, conan_file_path, ref,
+                                       hash_cache=layout.package_hashes(pref))
         else:
             prev = run_package_method(conanfile, package_id, source_folder, build_folder,
                                       dest_package_folder, install_folder, hook_manager,
-                                      conan_file_path, ref, local=True)
+                                      conan_file_path, ref, local=True,
+                                      hash_cache=layout.package_hashes(pref))
 
     packager.update_package_metadata(prev, layout, package_id, full_ref.revision)
     pref = PackageReference(pref.ref, pref.id, prev)
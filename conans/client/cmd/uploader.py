@@ -388,7 +388,7 @@ class CmdUpload(object):
         export_src_folder = self._cache.package_layout(ref).export_sources()
         src_files, src_symlinks = gather_files(export_src_folder)
         the_files = _compress_recipe_files(files, symlinks, src_files, src_symlinks, export_folder,
-                                           self._output)
+                                           self._output, **self._compression_args())
 
         return the_files
 
@@ -420,9 +420,15 @@ class CmdUpload(object):
             logger.debug("UPLOAD: Time remote_manager check package integrity : %f"
                          % (time.time() - t1))
 
-        the_files = _compress_package_files(files, symlinks, package_folder, self._output)
+        the_files = _compress_package_files(files, symlinks, package_folder, self._output,
+                                            **self._compression_args())
         return the_files
 
+    def _compression_args(self):
+        config = self._cache.config
+        return {"compresslevel": config.compression_level,
+                "parallel": config.parallel_compression}
+
     def _recipe_files_to_upload(self, ref, policy, the_files, remote, remote_manifest,
                                 local_manifest):
         self._remote_manager.check_credentials(remote)
@@ -542,7 +548,8 @@ class CmdUpload(object):
             self._output.info("Error printing information about the diff: %s" % str(e))
 
 
-def _compress_recipe_files(files, symlinks, src_files, src_symlinks, dest_folder, output):
+def _compress_recipe_files(files, symlinks, src_files, src_symlinks, dest_folder, output,
+                           compresslevel=None, parallel=None):
     # This is the minimum recipe
     result = {CONANFILE: files.pop(CONANFILE),
               CONAN_MANIFEST: files.pop(CONAN_MANIFEST)}
@@ -556,7 +563,8 @@ def _compress_recipe_files(files, symlinks, src_files, src_symlinks, dest_folder
         elif tgz_files:
             if output and not output.is_terminal:
                 output.writeln(msg)
-            tgz_path = compress_files(tgz_files, tgz_symlinks, tgz_name, dest_folder, output)
+            tgz_path = compress_files(tgz_files, tgz_symlinks, tgz_name, dest_folder, output,
+                                      compresslevel, parallel)
             result[tgz_name] = tgz_path
 
     add_tgz(EXPORT_TGZ_NAME, export_tgz_path, files, symlinks, "Compressing recipe...")
@@ -566,25 +574,28 @@ def _compress_recipe_files(files, symlinks, src_files, src_symlinks, dest_folder
     return result
 
 
-def _compress_package_files(files, symlinks, dest_folder, output):
+def _compress_package_files(files, symlinks, dest_folder, output, compresslevel=None,
+                            parallel=None):
     tgz_path = files.get(PACKAGE_TGZ_NAME)
     if not tgz_path:
         if output and not output.is_terminal:
             output.writeln("Compressing package...")
         tgz_files = {f: path for f, path in files.items() if f not in [CONANINFO, CONAN_MANIFEST]}
-        tgz_path = compress_files(tgz_files, symlinks, PACKAGE_TGZ_NAME, dest_folder, output)
+        tgz_path = compress_files(tgz_files, symlinks, PACKAGE_TGZ_NAME, dest_folder, output,
+                                  compresslevel, parallel)
 
     return {PACKAGE_TGZ_NAME: tgz_path,
             CONANINFO: files[CONANINFO],
             CONAN_MANIFEST: files[CONAN_MANIFEST]}
 
 
-def compress_files(files, symlinks, name, dest_dir, output=None):
+def compress_files(files, symlinks, name, dest_dir, output=None, compresslevel=None,
+                   parallel=None):
     t1 = time.time()
-    # FIXME, better write to disk sequentially and not keep tgz contents in memory
     tgz_path = os.path.join(dest_dir, name)
     with set_dirty_context_manager(tgz_path), open(tgz_path, "wb") as tgz_handle:
-        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle)
+        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle,
+                                        compresslevel=compresslevel, parallel=parallel)
 
         for filename, dest in sorted(symlinks.items()):
             info = tarfile.TarInfo(name=filename)
@@ -598,8 +609,9 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
                                                      "Compressing %s" % name) as pg_file_list:
             for filename, abs_path in pg_file_list:
                 info = tarfile.TarInfo(name=filename)
-                info.size = os.stat(abs_path).st_size
-                info.mode = os.stat(abs_path).st_mode & mask
+                file_stat = os.stat(abs_path)
+                info.size = file_stat.st_size
+                info.mode = file_stat.st_mode & mask
                 if os.path.islink(abs_path):
                     info.type = tarfile.SYMTYPE
                     info.size = 0  # A symlink shouldn't have size
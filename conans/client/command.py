@@ -2,6 +2,7 @@ import argparse
 import inspect
 import json
 import os
+import re
 import signal
 import sys
 from argparse import ArgumentError
@@ -601,6 +602,46 @@ class Command(object):
         elif args.subcommand == 'init':
             return self._conan.config_init(force=args.force)
 
+    def cache(self, *args):
+        """
+        Manages the download cache shared by Conan clients (storage.download_cache).
+
+        Use the subcommands 'stats' to show its contents and usage and 'prune' to remove the
+        least recently used files.
+        """
+        parser = argparse.ArgumentParser(description=self.cache.__doc__,
+                                         prog="conan cache",
+                                         formatter_class=SmartFormatter)
+        subparsers = parser.add_subparsers(dest='subcommand', help='sub-command help')
+        subparsers.required = True
+
+        subparsers.add_parser('stats', help='Show the size and hit ratio of the download cache')
+        prune_subparser = subparsers.add_parser('prune', help='Remove the least recently used '
+                                                              'files of the download cache')
+        prune_subparser.add_argument("max_size",
+                                     help="Target size of the cache, in bytes or with a K, M, or "
+                                          "G suffix, e.g. 20G")
+        args = parser.parse_args(*args)
+
+        if args.subcommand == "stats":
+            info = self._conan.download_cache_info()
+            requests = info["hits"] + info["misses"]
+            ratio = 100.0 * info["hits"] / requests if requests else 0
+            self._out.writeln("Files: %s (%s urls)" % (info["files"], info["urls"]))
+            self._out.writeln("Size: %s" % _format_size(info["size"]))
+            self._out.writeln("Hits: %s (%s)" % (info["hits"], _format_size(info["hit_bytes"])))
+            self._out.writeln("Misses: %s (%s)" % (info["misses"],
+                                                    _format_size(info["miss_bytes"])))
+            self._out.writeln("Hit ratio: %.1f%%" % ratio)
+        elif args.subcommand == "prune":
+            match = re.match(r"^(\d+)([KMG]?)B?$", args.max_size.strip().upper())
+            if not match:
+                raise ConanException("Invalid size '%s'" % args.max_size)
+            max_size = int(match.group(1)) * 1024 ** " KMG".index(match.group(2) or " ")
+            removed, removed_size = self._conan.download_cache_prune(max_size)
+            self._out.success("Removed %s files (%s) from the download cache"
+                              % (removed, _format_size(removed_size)))
+
     def info(self, *args):
         """
         Gets information about the dependency graph of a recipe.
@@ -1877,7 +1918,8 @@ class Command(object):
                 ("Package development commands", ("source", "build", "package", "editable",
                                                   "workspace")),
                 ("Misc commands", ("profile", "remote", "user", "imports", "copy", "remove",
-                                   "alias", "download", "inspect", "help", "graph", "frogarian"))]
+                                   "alias", "download", "inspect", "help", "graph", "cache",
+                                   "frogarian"))]
 
         def check_all_commands_listed():
             """Keep updated the main directory, raise if don't"""
@@ -2050,6 +2092,15 @@ class Command(object):
         return ret_code
 
 
+def _format_size(size):
+    if size < 1024:
+        return "%d B" % size
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024.0
+        if size < 1024 or unit == "GB":
+            return "%.1f %s" % (size, unit)
+
+
 def _add_manifests_arguments(parser):
     parser.add_argument("-m", "--manifests", const=default_manifest_folder, nargs="?",
                         help='Install dependencies manifests in folder for later verify.'
@@ -198,9 +198,11 @@ class ConanApp(object):
 
         self.proxy = ConanProxy(self.cache, self.out, self.remote_manager)
         self.range_resolver = RangeResolver(self.cache, self.remote_manager)
-        self.python_requires = ConanPythonRequire(self.proxy, self.range_resolver)
+        self.python_requires = ConanPythonRequire(self.proxy, self.range_resolver,
+                                                  self.cache.bytecode_folder)
         self.pyreq_loader = PyRequireLoader(self.proxy, self.range_resolver)
-        self.loader = ConanFileLoader(self.runner, self.out, self.python_requires, self.pyreq_loader)
+        self.loader = ConanFileLoader(self.runner, self.out, self.python_requires, self.pyreq_loader,
+                                      self.cache.bytecode_folder)
 
         self.binaries_analyzer = GraphBinariesAnalyzer(self.cache, self.out, self.remote_manager)
         self.graph_manager = GraphManager(self.out, self.cache, self.remote_manager, self.loader,
@@ -624,6 +626,23 @@ class ConanAPIV1(object):
             self.app.cache.initialize_default_profile()
             self.app.cache.initialize_settings()
 
+    def _download_cache(self):
+        download_cache = self.app.config.download_cache
+        if not download_cache:
+            raise ConanException("There is no download cache, configure "
+                                 "'storage.download_cache' first")
+        return download_cache
+
+    @api_method
+    def download_cache_info(self):
+        from conans.client.rest.download_cache import download_cache_info
+        return download_cache_info(self._download_cache())
+
+    @api_method
+    def download_cache_prune(self, max_size):
+        from conans.client.rest.download_cache import prune_download_cache
+        return prune_download_cache(self._download_cache(), max_size)
+
     def _info_args(self, reference_or_path, install_folder, profile_host, profile_build, lockfile=None):
         cwd = get_cwd()
         if check_valid_ref(reference_or_path):
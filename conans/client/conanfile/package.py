@@ -17,7 +17,7 @@ from conans.util.log import logger
 
 def run_package_method(conanfile, package_id, source_folder, build_folder, package_folder,
                        install_folder, hook_manager, conanfile_path, ref, local=False,
-                       copy_info=False):
+                       copy_info=False, hash_cache=None):
     """ calls the recipe "package()" method
     - Assigns folders to conanfile.package_folder, source_folder, install_folder, build_folder
     - Calls pre-post package hook
@@ -36,11 +36,12 @@ def run_package_method(conanfile, package_id, source_folder, build_folder, packa
 
     with get_env_context_manager(conanfile):
         return _call_package(conanfile, package_id, source_folder, build_folder, package_folder,
-                             install_folder, hook_manager, conanfile_path, ref, local, copy_info)
+                             install_folder, hook_manager, conanfile_path, ref, local, copy_info,
+                             hash_cache)
 
 
 def _call_package(conanfile, package_id, source_folder, build_folder, package_folder,
-                  install_folder, hook_manager, conanfile_path, ref, local, copy_info):
+                  install_folder, hook_manager, conanfile_path, ref, local, copy_info, hash_cache):
     output = conanfile.output
     try:
         hook_manager.execute("pre_package", conanfile=conanfile, conanfile_path=conanfile_path,
@@ -70,7 +71,7 @@ def _call_package(conanfile, package_id, source_folder, build_folder, package_fo
     hook_manager.execute("post_package", conanfile=conanfile, conanfile_path=conanfile_path,
                          reference=ref, package_id=package_id)
 
-    manifest = _create_aux_files(install_folder, package_folder, conanfile, copy_info)
+    manifest = _create_aux_files(install_folder, package_folder, conanfile, copy_info, hash_cache)
     package_output = ScopedOutput("%s package()" % output.scope, output)
     report_files_from_manifest(package_output, manifest)
     package_id = package_id or os.path.basename(package_folder)
@@ -82,7 +83,7 @@ def _call_package(conanfile, package_id, source_folder, build_folder, package_fo
     return prev
 
 
-def _create_aux_files(install_folder, package_folder, conanfile, copy_info):
+def _create_aux_files(install_folder, package_folder, conanfile, copy_info, hash_cache):
     """ auxiliary method that creates CONANINFO and manifest in
     the package_folder
     """
@@ -98,6 +99,6 @@ def _create_aux_files(install_folder, package_folder, conanfile, copy_info):
         save(os.path.join(package_folder, CONANINFO), conanfile.info.dumps())
 
     # Create the digest for the package
-    manifest = FileTreeManifest.create(package_folder)
+    manifest = FileTreeManifest.create(package_folder, hash_cache=hash_cache)
     manifest.save(package_folder)
     return manifest
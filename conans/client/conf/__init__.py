@@ -165,6 +165,11 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # msbuild_verbosity = minimal         # environment CONAN_MSBUILD_VERBOSITY
 
     # cpu_count = 1             # environment CONAN_CPU_COUNT
+    # parallel_graph_fetch = 8            # environment CONAN_PARALLEL_GRAPH_FETCH
+    # parallel_binary_analysis = 8        # environment CONAN_PARALLEL_BINARY_ANALYSIS
+    # parallel_build = 4                  # environment CONAN_PARALLEL_BUILD
+    # parallel_compression = 4            # environment CONAN_PARALLEL_COMPRESSION
+    # parallel_extraction = 4             # environment CONAN_PARALLEL_EXTRACTION
 
     # Change the default location for building test packages to a temporary folder
     # which is deleted after the test.
@@ -178,6 +183,9 @@ _t_default_client_conf = Template(textwrap.dedent("""
 
     # config_install_interval = 1h
 
+    # Reuse the versions listed in the remotes to resolve version ranges during this time
+    # version_ranges_ttl = 1h             # environment CONAN_VERSION_RANGES_TTL
+
     [storage]
     # This is the default path, but you can write your own. It must be an absolute path or a
     # path beginning with "~" (if the environment var CONAN_USER_HOME is specified, this directory, even
@@ -433,6 +441,59 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'parallel_download'")
 
+    def _get_parallel_jobs(self, env_var, item):
+        try:
+            parallel = get_env(env_var)
+            if parallel is None:
+                parallel = self.get_item("general.%s" % item)
+        except ConanException:
+            return None
+
+        try:
+            parallel = int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for '%s'" % item)
+        if parallel is not None and parallel < 1:
+            raise ConanException("'%s' must be a number greater than 0" % item)
+        return parallel
+
+    @property
+    def parallel_graph_fetch(self):
+        return self._get_parallel_jobs("CONAN_PARALLEL_GRAPH_FETCH", "parallel_graph_fetch")
+
+    @property
+    def parallel_binary_analysis(self):
+        return self._get_parallel_jobs("CONAN_PARALLEL_BINARY_ANALYSIS",
+                                       "parallel_binary_analysis")
+
+    @property
+    def parallel_build(self):
+        return self._get_parallel_jobs("CONAN_PARALLEL_BUILD", "parallel_build")
+
+    @property
+    def parallel_compression(self):
+        return self._get_parallel_jobs("CONAN_PARALLEL_COMPRESSION", "parallel_compression")
+
+    @property
+    def parallel_extraction(self):
+        return self._get_parallel_jobs("CONAN_PARALLEL_EXTRACTION", "parallel_extraction")
+
+    @property
+    def compression_level(self):
+        try:
+            level = get_env("CONAN_COMPRESSION_LEVEL")
+            if level is None:
+                level = self.get_item("general.compression_level")
+        except ConanException:
+            return None
+        try:
+            level = int(level)
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'compression_level'")
+        if not 0 <= level <= 9:
+            raise ConanException("'compression_level' must be a number between 0 and 9")
+        return level
+
     @property
     def download_cache(self):
         try:
@@ -696,7 +757,20 @@ class ConanClientConfigParser(ConfigParser, object):
             interval = self.get_item("general.config_install_interval")
         except ConanException:
             return None
+        return self._time_interval("config_install_interval", interval)
+
+    @property
+    def version_ranges_ttl(self):
+        try:
+            ttl = get_env("CONAN_VERSION_RANGES_TTL")
+            if ttl is None:
+                ttl = self.get_item("general.version_ranges_ttl")
+        except ConanException:
+            return None
+        return self._time_interval("version_ranges_ttl", ttl)
 
+    @staticmethod
+    def _time_interval(item, interval):
         match = re.search(r"(\d+)([mhd])", interval)
         try:
             value, unit = match.group(1), match.group(2)
@@ -707,5 +781,4 @@ class ConanClientConfigParser(ConfigParser, object):
             else:
                 return timedelta(days=float(value))
         except Exception as e:
-            raise ConanException("Incorrect definition of general.config_install_interval: %s"
-                                 % interval)
+            raise ConanException("Incorrect definition of general.%s: %s" % (item, interval))
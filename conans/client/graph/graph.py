@@ -246,6 +246,7 @@ class DepsGraph(object):
         self.root = None
         self.aliased = {}
         self._node_counter = initial_node_id if initial_node_id is not None else -1
+        self._levels_cache = {}  # {(direct, frozenset(node ids) or None): levels}
 
     def add_node(self, node):
         if node.id is None:
@@ -254,12 +255,14 @@ class DepsGraph(object):
         if not self.nodes:
             self.root = node
         self.nodes.add(node)
+        self._levels_cache.clear()
 
     def add_edge(self, src, dst, require):
         assert src in self.nodes and dst in self.nodes
         edge = Edge(src, dst, require)
         src.add_edge(edge)
         dst.add_edge(edge)
+        self._levels_cache.clear()
 
     def ordered_iterate(self, nodes_subset=None):
         ordered = self.by_levels(nodes_subset)
@@ -367,21 +370,50 @@ class DepsGraph(object):
         dependencies. Second level will be with nodes that only have dependencies to
         first level nodes, and so on
         return [[node1, node34], [node3], [node23, node8],...]
+
+        The levels are cached until a node or an edge is added to the graph
+        """
+        # Nodes are identified by id(), their hash is expensive and they are never removed
+        key = direct, frozenset(map(id, nodes_subset)) if nodes_subset is not None else None
+        levels = self._levels_cache.get(key)
+        if levels is None:
+            levels = self._compute_levels(direct, nodes_subset)
+            self._levels_cache[key] = levels
+        # Return new lists, so callers can freely modify them without breaking the cache
+        return [list(level) for level in levels]
+
+    def _compute_levels(self, direct, nodes_subset):
+        """ Kahn-style layering: every node counts its pending neighbors, and it goes to
+        the next level when all of them have been assigned a level
         """
-        result = []
         opened = nodes_subset if nodes_subset is not None else self.nodes
-        while opened:
-            current_level = []
-            for o in opened:
-                o_neighs = o.neighbors() if direct else o.inverse_neighbors()
-                if not any(n in opened for n in o_neighs):
-                    current_level.append(o)
+        opened_ids = set(map(id, opened))
+        pending = {}  # {id(node): number of neighbors without level}
+        waiting = {}  # {id(node): [nodes that have it as neighbor]}
+        current_level = []
+        for node in opened:
+            neighbors = node.neighbors() if direct else node.inverse_neighbors()
+            neighbors = set(id(n) for n in neighbors if id(n) in opened_ids)
+            pending[id(node)] = len(neighbors)
+            if not neighbors:
+                current_level.append(node)
+            for neighbor in neighbors:
+                waiting.setdefault(neighbor, []).append(node)
 
+        result = []
+        while current_level:
             current_level.sort()
             result.append(current_level)
             # now initialize new level
-            opened = opened.difference(current_level)
-
+            new_level = []
+            for node in current_level:
+                for waiting_node in waiting.get(id(node), []):
+                    pending[id(waiting_node)] -= 1
+                    if not pending[id(waiting_node)]:
+                        new_level.append(waiting_node)
+            current_level = new_level
+
+        assert sum(len(level) for level in result) == len(opened), "Loop in the graph"
         return result
 
     def mark_private_skippable(self, nodes_subset=None, root=None):
@@ -1,9 +1,14 @@
 import os
+import sys
+from multiprocessing.pool import ThreadPool
+
+import six
 
 from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING,
                                        BINARY_UPDATE, RECIPE_EDITABLE, BINARY_EDITABLE,
                                        RECIPE_CONSUMER, RECIPE_VIRTUAL, BINARY_SKIP, BINARY_UNKNOWN)
+from conans.client.output import BufferedOutput, capture_thread_output
 from conans.errors import NoRemoteAvailable, NotFoundException, conanfile_exception_formatter
 from conans.model.info import ConanInfo, PACKAGE_ID_UNKNOWN
 from conans.model.manifest import FileTreeManifest
@@ -12,6 +17,16 @@ from conans.util.conan_v2_mode import conan_v2_property
 from conans.util.files import is_dirty, rmdir
 
 
+class _RemoteLookup(object):
+    """ The result (or exception) of a remote package-info/manifest request done
+    concurrently, together with the output it produced
+    """
+    def __init__(self, result, exc_info, output):
+        self.result = result
+        self.exc_info = exc_info
+        self.output = output
+
+
 class GraphBinariesAnalyzer(object):
 
     def __init__(self, cache, output, remote_manager):
@@ -21,6 +36,8 @@ class GraphBinariesAnalyzer(object):
         # These are the nodes with pref (not including PREV) that have been evaluated
         self._evaluated = {}  # {pref: [nodes]}
         self._fixed_package_id = cache.config.full_transitive_package_id
+        # Results of the concurrent remote requests of the current graph level
+        self._remote_lookups = {}  # {(method, pref, remote_name): _RemoteLookup}
 
     @staticmethod
     def _check_update(upstream_manifest, package_folder, output):
@@ -76,7 +93,7 @@ class GraphBinariesAnalyzer(object):
             output = node.conanfile.output
             if remote:
                 try:
-                    tmp = self._remote_manager.get_package_manifest(pref, remote)
+                    tmp = self._remote_call("get_package_manifest", pref, remote)
                     upstream_manifest, pref = tmp
                 except NotFoundException:
                     output.warn("Can't update, no package in remote")
@@ -100,7 +117,7 @@ class GraphBinariesAnalyzer(object):
         remote_info = None
         if remote:
             try:
-                remote_info, pref = self._remote_manager.get_package_info(pref, remote)
+                remote_info, pref = self._remote_call("get_package_info", pref, remote)
             except NotFoundException:
                 pass
             except Exception:
@@ -112,7 +129,7 @@ class GraphBinariesAnalyzer(object):
         if not remote or (not remote_info and self._cache.config.revisions_enabled):
             for r in remotes.values():
                 try:
-                    remote_info, pref = self._remote_manager.get_package_info(pref, r)
+                    remote_info, pref = self._remote_call("get_package_info", pref, r)
                 except NotFoundException:
                     pass
                 else:
@@ -318,20 +335,121 @@ class GraphBinariesAnalyzer(object):
         info = conanfile.info
         node.package_id = info.package_id()
 
+    def _remote_call(self, method, pref, remote):
+        lookup = self._remote_lookups.pop((method, pref, remote.name), None)
+        if lookup is None:
+            return getattr(self._remote_manager, method)(pref, remote)
+        lookup.output.replay(self._out)
+        if lookup.exc_info is not None:
+            six.reraise(*lookup.exc_info)
+        return lookup.result
+
+    def _node_remote_requests(self, node, update, remotes):
+        """ the remote requests that _process_node() is expected to do for the main package ID
+        of this node. It doesn't need to be exact, requests not consumed are just discarded
+        """
+        if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL, RECIPE_EDITABLE):
+            return []
+        if node.package_id == PACKAGE_ID_UNKNOWN:
+            return []
+        locked = node.graph_lock_node
+        if locked and locked.pref.id == node.package_id:
+            pref = locked.pref
+        else:
+            pref = PackageReference(node.ref, node.package_id)
+        if pref in self._evaluated:
+            return []
+
+        package_layout = self._cache.package_layout(pref.ref,
+                                                    short_paths=node.conanfile.short_paths)
+        remote = remotes.selected
+        if not remote:
+            metadata = package_layout.load_metadata()
+            remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
+            remote = remotes.get(remote_name)
+
+        if os.path.exists(package_layout.package(pref)):
+            return [("get_package_manifest", pref, remote)] if update and remote else []
+
+        result = [("get_package_info", pref, remote)] if remote else []
+        if not remote or self._cache.config.revisions_enabled:
+            result.extend(("get_package_info", pref, r) for r in remotes.values() if r != remote)
+        return result
+
+    def _prefetch_remote_requests(self, level, build_mode, update, remotes, parallel):
+        """ launches concurrently all the package-info and manifest requests of the nodes of
+        a graph level. The nodes are evaluated later sequentially, in the same order, and
+        they take these results instead of requesting them again
+        """
+        if build_mode.all:  # Everything will be built, nothing to check in remotes
+            return
+        requests = []
+        for node in level:
+            for request in self._node_remote_requests(node, update, remotes):
+                if request not in requests:
+                    requests.append(request)
+        if len(requests) < 2:
+            return
+
+        def _request(request):
+            method, pref, remote = request
+            output = BufferedOutput()
+            with capture_thread_output(output):
+                try:
+                    result = getattr(self._remote_manager, method)(pref, remote)
+                    return _RemoteLookup(result, None, output)
+                except Exception:
+                    return _RemoteLookup(None, sys.exc_info(), output)
+
+        thread_pool = ThreadPool(min(parallel, len(requests)))
+        try:
+            lookups = thread_pool.map(_request, requests)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        for (method, pref, remote), lookup in zip(requests, lookups):
+            self._remote_lookups[(method, pref, remote.name)] = lookup
+
     def evaluate_graph(self, deps_graph, build_mode, update, remotes, nodes_subset=None, root=None):
         default_package_id_mode = self._cache.config.default_package_id_mode
         default_python_requires_id_mode = self._cache.config.default_python_requires_id_mode
-        for node in deps_graph.ordered_iterate(nodes_subset=nodes_subset):
-            self._propagate_options(node)
-
-            self._compute_package_id(node, default_package_id_mode, default_python_requires_id_mode)
-            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                continue
-            if node.package_id == PACKAGE_ID_UNKNOWN:
-                assert node.binary is None, "Node.binary should be None"
-                node.binary = BINARY_UNKNOWN
-                continue
-            self._evaluate_node(node, build_mode, update, remotes)
+        parallel = self._cache.config.parallel_binary_analysis
+        for level in deps_graph.by_levels(nodes_subset):
+            if parallel and parallel > 1:
+                # All the package IDs of the level are needed before the remote requests. The
+                # output of package_id() is replayed later to keep the sequential order
+                outputs = []
+                for node in level:
+                    outputs.append(BufferedOutput())
+                    try:
+                        with capture_thread_output(outputs[-1]):
+                            self._propagate_options(node)
+                            self._compute_package_id(node, default_package_id_mode,
+                                                     default_python_requires_id_mode)
+                    except Exception:
+                        for output in outputs:
+                            output.replay(self._out)
+                        raise
+                self._prefetch_remote_requests(level, build_mode, update, remotes, parallel)
+            else:
+                outputs = None
+
+            for index, node in enumerate(level):
+                if outputs is not None:
+                    outputs[index].replay(self._out)
+                else:
+                    self._propagate_options(node)
+                    self._compute_package_id(node, default_package_id_mode,
+                                             default_python_requires_id_mode)
+                if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                    continue
+                if node.package_id == PACKAGE_ID_UNKNOWN:
+                    assert node.binary is None, "Node.binary should be None"
+                    node.binary = BINARY_UNKNOWN
+                    continue
+                self._evaluate_node(node, build_mode, update, remotes)
+            # Requests not used by the evaluation (e.g. other remotes) are discarded
+            self._remote_lookups.clear()
         deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
 
     def reevaluate_node(self, node, remotes, build_mode, update):
@@ -1,7 +1,12 @@
+import sys
 import time
+from multiprocessing.pool import ThreadPool
+
+import six
 
 from conans.client.conanfile.configure import run_configure_method
 from conans.client.graph.graph import DepsGraph, Node, RECIPE_EDITABLE, CONTEXT_HOST, CONTEXT_BUILD
+from conans.client.output import BufferedOutput, capture_thread_output
 from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
                            conanfile_exception_formatter)
 from conans.model.conan_file import get_env_context_manager
@@ -10,6 +15,36 @@ from conans.model.requires import Requirements, Requirement
 from conans.util.log import logger
 
 
+class _RecorderBuffer(object):
+    """ Stores the calls done to the ActionRecorder by a concurrent recipe fetch, so they
+    can be applied later, in the same order as the sequential graph expansion would do
+    """
+
+    def __init__(self):
+        self._calls = []
+
+    def recipe_fetched_from_cache(self, ref):
+        self._calls.append(("recipe_fetched_from_cache", (ref, )))
+
+    def recipe_downloaded(self, ref, remote_name):
+        self._calls.append(("recipe_downloaded", (ref, remote_name)))
+
+    def recipe_install_error(self, ref, error_type, description, remote_name):
+        self._calls.append(("recipe_install_error", (ref, error_type, description, remote_name)))
+
+    def replay(self, recorder):
+        for method, args in self._calls:
+            getattr(recorder, method)(*args)
+
+
+class _PrefetchedRecipe(object):
+    def __init__(self, result, exc_info, output, recorder):
+        self.result = result
+        self.exc_info = exc_info
+        self.output = output
+        self.recorder = recorder
+
+
 class DepsGraphBuilder(object):
     """
     This is a summary, in pseudo-code of the execution and structure of the graph
@@ -38,14 +73,23 @@ class DepsGraphBuilder(object):
                         check_conflicts(req)                          # diamonds can cause conflicts
                         if need_recurse:                              # check for conflicts upstream
                             expand_node(previous_node)                # recursion
+
+    If "parallel_fetch" is defined, the recipes of all the requirements of a node are
+    retrieved concurrently (prefetch_recipes) before 2., and every create_new_node() takes
+    the prefetched result instead of calling the proxy. The output and the recorder actions
+    of each fetch are buffered and replayed when consumed, so the result is the same as the
+    sequential one
     """
 
-    def __init__(self, proxy, output, loader, resolver, recorder):
+    def __init__(self, proxy, output, loader, resolver, recorder, parallel_fetch=None):
         self._proxy = proxy
         self._output = output
         self._loader = loader
         self._resolver = resolver
         self._recorder = recorder
+        # A single worker would be the same as the sequential resolution
+        self._parallel_fetch = parallel_fetch if parallel_fetch and parallel_fetch > 1 else None
+        self._prefetched = {}
 
     def load_graph(self, root_node, check_updates, update, remotes, profile_host, profile_build,
                    graph_lock=None):
@@ -94,6 +138,7 @@ class DepsGraphBuilder(object):
             graph_lock.lock_node(node, build_requires, build_requires=True)
 
         self._resolve_ranges(graph, build_requires, scope, update, remotes)
+        self._prefetch_recipes(node, build_requires, check_updates, update, remotes)
 
         for br in build_requires:
             context_switch = bool(br.build_require_context == CONTEXT_BUILD)
@@ -120,6 +165,8 @@ class DepsGraphBuilder(object):
         # basic node configuration: calling configure() and requirements() and version-ranges
         new_options, new_reqs = self._get_node_requirements(node, graph, down_ref, down_options,
                                                             down_reqs, graph_lock, update, remotes)
+        self._prefetch_recipes(node, node.conanfile.requires.values(), check_updates, update,
+                               remotes)
 
         # Expand each one of the current requirements
         for require in node.conanfile.requires.values():
@@ -129,6 +176,58 @@ class DepsGraphBuilder(object):
                                  profile_build, new_reqs, new_options, graph_lock,
                                  context_switch=False)
 
+    def _prefetch_recipes(self, node, requires, check_updates, update, remotes):
+        """ concurrently retrieves the recipes of the given requirements (already resolved
+        version ranges), so later _resolve_recipe() calls do not wait for the network
+        sequentially
+        """
+        if not self._parallel_fetch:
+            return
+        refs = []
+        for require in requires:
+            ref = require.ref
+            if require.override or ref in self._prefetched or ref in refs:
+                continue
+            # Diamonds with the same reference do not need to fetch the recipe again
+            context = (CONTEXT_BUILD if require.build_require_context == CONTEXT_BUILD
+                       else node.context)
+            previous = node.public_deps.get(ref.name, context=context)
+            if previous and not self._conflicting_references(previous, ref):
+                continue
+            refs.append(ref)
+        if len(refs) < 2:
+            return
+
+        def _fetch(the_ref):
+            output = BufferedOutput()
+            recorder = _RecorderBuffer()
+            with capture_thread_output(output):
+                try:
+                    result = self._proxy.get_recipe(the_ref, check_updates, update, remotes,
+                                                    recorder)
+                    return _PrefetchedRecipe(result, None, output, recorder)
+                except Exception:
+                    return _PrefetchedRecipe(None, sys.exc_info(), output, recorder)
+
+        thread_pool = ThreadPool(min(self._parallel_fetch, len(refs)))
+        try:
+            prefetched = thread_pool.map(_fetch, refs)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        for ref, fetched in zip(refs, prefetched):
+            self._prefetched[ref] = fetched
+
+    def _get_recipe(self, ref, check_updates, update, remotes):
+        fetched = self._prefetched.pop(ref, None)
+        if fetched is None:
+            return self._proxy.get_recipe(ref, check_updates, update, remotes, self._recorder)
+        fetched.output.replay(self._output)
+        fetched.recorder.replay(self._recorder)
+        if fetched.exc_info is not None:
+            six.reraise(*fetched.exc_info)
+        return fetched.result
+
     def _resolve_ranges(self, graph, requires, consumer, update, remotes):
         for require in requires:
             if require.locked_id:  # if it is locked, nothing to resolved
@@ -354,8 +453,7 @@ class DepsGraphBuilder(object):
     def _resolve_recipe(self, current_node, dep_graph, requirement, check_updates,
                         update, remotes, profile, graph_lock, original_ref=None):
         try:
-            result = self._proxy.get_recipe(requirement.ref, check_updates, update,
-                                            remotes, self._recorder)
+            result = self._get_recipe(requirement.ref, check_updates, update, remotes)
         except ConanException as e:
             if current_node.ref:
                 self._output.error("Failed requirement '%s' from '%s'"
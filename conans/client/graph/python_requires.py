@@ -147,10 +147,11 @@ class PyRequireLoader(object):
 
 
 class ConanPythonRequire(object):
-    def __init__(self, proxy, range_resolver):
+    def __init__(self, proxy, range_resolver, bytecode_folder=None):
         self._cached_requires = {}  # {reference: PythonRequire}
         self._proxy = proxy
         self._range_resolver = range_resolver
+        self._bytecode_folder = bytecode_folder
         self._requires = None
         self.valid = True
         self._check_updates = False
@@ -184,7 +185,8 @@ class ConanPythonRequire(object):
                                             remotes=self._remotes,
                                             recorder=ActionRecorder())
             path, _, _, new_ref = result
-            module, conanfile = parse_conanfile(conanfile_path=path, python_requires=self)
+            module, conanfile = parse_conanfile(conanfile_path=path, python_requires=self,
+                                                bytecode_folder=self._bytecode_folder)
 
             # Check for alias
             if getattr(conanfile, "alias", None):
@@ -2,7 +2,6 @@ import re
 
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference
-from conans.search.search import search_recipes
 
 re_param = re.compile(r"^(?P<function>include_prerelease|loose)\s*=\s*(?P<value>True|False)$")
 re_version = re.compile(r"^((?!(include_prerelease|loose))[a-zA-Z0-9_+.\-~<>=|*^\s])*$")
@@ -51,12 +50,31 @@ def _parse_versionexpr(versionexpr, result):
     return version_range, loose, include_prerelease
 
 
+_parsed_versions = {}  # {(version, loose): SemVer or None if not semver}
+
+
+def _parse_version(version, loose):
+    """ parses the version just once, the same versions are checked against many ranges
+    """
+    key = str(version), loose
+    try:
+        return _parsed_versions[key]
+    except KeyError:
+        from semver import SemVer
+        try:
+            result = SemVer(version, loose=loose)
+        except (ValueError, AttributeError):
+            result = None
+        _parsed_versions[key] = result
+        return result
+
+
 def satisfying(list_versions, versionexpr, result):
     """ returns the maximum version that satisfies the expression
     if some version cannot be converted to loose SemVer, it is discarded with a msg
     This provides some workaround for failing comparisons like "2.1" not matching "<=2.1"
     """
-    from semver import SemVer, Range, max_satisfying
+    from semver import Range, max_satisfying
     version_range, loose, include_prerelease = _parse_versionexpr(versionexpr, result)
 
     # Check version range expression
@@ -68,10 +86,10 @@ def satisfying(list_versions, versionexpr, result):
     # Validate all versions
     candidates = {}
     for v in list_versions:
-        try:
-            ver = SemVer(v, loose=loose)
+        ver = _parse_version(v, loose)
+        if ver is not None:
             candidates[ver] = v
-        except (ValueError, AttributeError):
+        else:
             result.append("WARN: Version '%s' is not semver, cannot be compared with a range"
                           % str(v))
 
@@ -87,6 +105,7 @@ class RangeResolver(object):
         self._cache = cache
         self._remote_manager = remote_manager
         self._cached_remote_found = {}
+        self._range_index = None
         self._result = []
 
     @property
@@ -140,18 +159,29 @@ class RangeResolver(object):
                                  % (version_range, require, base_conanref, origin))
 
     def _resolve_local(self, search_ref, version_range):
-        local_found = search_recipes(self._cache, search_ref)
+        # Only the references with this name, the whole cache is not walked
+        local_found = self._cache.all_refs(search_ref.name)
+        local_found.extend(ref for ref in self._cache.editable_packages.edited_refs
+                           if ref.name.lower() == search_ref.name.lower())
         local_found = [ref for ref in local_found
                        if ref.user == search_ref.user and
                        ref.channel == search_ref.channel]
         if local_found:
-            return self._resolve_version(version_range, local_found)
+            return self._resolve_version(version_range, sorted(local_found))
+
+    def _search_remote(self, remote, name):
+        if self._range_index is None:
+            self._range_index = self._cache.range_index
+        refs = self._range_index.get(remote, name)
+        if refs is None:
+            refs = self._remote_manager.search_recipes(remote, name, ignorecase=False)
+            self._range_index.set(remote, name, refs)
+        return refs
 
     def _search_remotes(self, search_ref, remotes):
         for remote in remotes.values():
             if not remotes.selected or remote == remotes.selected:
-                search_result = self._remote_manager.search_recipes(remote, search_ref.name,
-                                                                    ignorecase=False)
+                search_result = self._search_remote(remote, search_ref.name)
                 search_result = [ref for ref in search_result
                                  if ref.user == search_ref.user and
                                  ref.channel == search_ref.channel]
@@ -1,9 +1,14 @@
 import os
+import pickle
+import select
 import shutil
+import sys
 import textwrap
 import time
 from multiprocessing.pool import ThreadPool
 
+import six
+
 from conans.client import tools
 from conans.client.conanfile.build import run_build_method
 from conans.client.conanfile.package import run_package_method
@@ -12,6 +17,7 @@ from conans.client.generators import TXTGenerator, write_generators
 from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_EDITABLE, \
     BINARY_MISSING, BINARY_SKIP, BINARY_UPDATE, BINARY_UNKNOWN, CONTEXT_HOST
 from conans.client.importer import remove_imports, run_imports
+from conans.client.output import BufferedOutput, capture_thread_output
 from conans.client.packager import update_package_metadata
 from conans.client.recorder.action_recorder import INSTALL_ERROR_BUILDING, INSTALL_ERROR_MISSING, \
     INSTALL_ERROR_MISSING_BUILD_FOLDER
@@ -161,7 +167,8 @@ class _PackageBuilder(object):
         install_folder = build_folder  # While installing, the infos goes to build folder
         prev = run_package_method(conanfile, package_id, source_folder, build_folder,
                                   package_folder, install_folder, self._hook_manager,
-                                  conanfile_path, pref.ref)
+                                  conanfile_path, pref.ref,
+                                  hash_cache=package_layout.package_hashes(pref))
 
         update_package_metadata(prev, package_layout, package_id, pref.ref.revision)
 
@@ -268,6 +275,52 @@ def call_system_requirements(conanfile, output):
         raise ConanException("Error in system requirements")
 
 
+class _BuildRecorderBuffer(object):
+    """ Stores the ActionRecorder calls of a package built in a child process, to send them
+    back to the main process
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def package_built(self, pref):
+        self.calls.append(("package_built", (pref, )))
+
+    def package_install_error(self, pref, error_type, description, remote_name=None):
+        self.calls.append(("package_install_error", (pref, error_type, description, remote_name)))
+
+
+class _BuildJob(object):
+    """ A package being built in a forked child process. The child sends through a pipe its
+    output, recorder actions and result when it finishes
+    """
+
+    def __init__(self, node, pid, read_fd):
+        self.node = node
+        self.pid = pid
+        self.read_fd = read_fd
+        self.waiting = []  # Other nodes with the same pref, waiting for this build
+        self._data = []
+
+    def read(self):
+        """ returns False when the child closed the pipe """
+        chunk = os.read(self.read_fd, 65536)
+        if chunk:
+            self._data.append(chunk)
+            return True
+        os.close(self.read_fd)
+        os.waitpid(self.pid, 0)
+        return False
+
+    def result(self):
+        try:
+            return pickle.loads(b"".join(self._data))
+        except Exception:
+            return [], [], {"error": "Build process of %s didn't finish correctly"
+                                     % str(self.node.pref),
+                            "user_error": False}
+
+
 class BinaryInstaller(object):
     """ main responsible of retrieving binary packages or building them from source
     locally in case they are not found in remotes
@@ -279,6 +332,8 @@ class BinaryInstaller(object):
         self._recorder = recorder
         self._binaries_analyzer = app.binaries_analyzer
         self._hook_manager = app.hook_manager
+        self._download_pool = None
+        self._pending_downloads = {}  # {pref: (AsyncResult, BufferedOutput)}
 
     def install(self, deps_graph, remotes, build_mode, update, keep_build=False, graph_info=None):
         # order by levels and separate the root node (ref=None) from the rest
@@ -361,23 +416,47 @@ class BinaryInstaller(object):
             assert node.prev, "PREV for %s is None" % str(node.pref)
             download_nodes.append(node)
 
-        def _download(n):
+        def _download(n, output=None):
             npref = n.pref
             layout = self._cache.package_layout(npref.ref, n.conanfile.short_paths)
-            with layout.package_lock(npref):
-                self._download_pkg(layout, npref, n)
+            with capture_thread_output(output):
+                with layout.package_lock(npref):
+                    self._download_pkg(layout, npref, n)
 
         parallel = self._cache.config.parallel_download
         if parallel is not None:
+            # The downloads (and unzip) run in the background, every node waits only for its
+            # own download when it is processed, so package_info() and the rest of the
+            # installation can run while the following packages are still downloading
             self._out.info("Downloading binary packages in %s parallel threads" % parallel)
-            thread_pool = ThreadPool(parallel)
-            thread_pool.map(_download, [n for n in download_nodes])
-            thread_pool.close()
-            thread_pool.join()
+            self._download_pool = ThreadPool(parallel)
+            for node in download_nodes:
+                output = BufferedOutput()
+                result = self._download_pool.apply_async(_download, (node, output))
+                self._pending_downloads[node.pref] = result, output
+            self._download_pool.close()
         else:
             for node in download_nodes:
                 _download(node)
 
+    def _wait_download(self, pref):
+        pending = self._pending_downloads.pop(pref, None)
+        if pending is not None:
+            result, output = pending
+            try:
+                result.get()
+            finally:
+                output.replay(self._out)
+
+    def _finish_downloads(self, terminate):
+        if self._download_pool is None:
+            return
+        if terminate:
+            self._download_pool.terminate()
+        self._download_pool.join()
+        self._download_pool = None
+        self._pending_downloads.clear()
+
     def _download_pkg(self, layout, pref, node):
         conanfile = node.conanfile
         package_folder = layout.package(pref)
@@ -396,29 +475,173 @@ class BinaryInstaller(object):
         processed_package_refs = set()
         self._download(downloads, processed_package_refs)
 
-        for level in nodes_by_level:
-            for node in level:
-                ref, conan_file = node.ref, node.conanfile
-                output = conan_file.output
-
-                self._propagate_info(node, using_build_profile)
-                if node.binary == BINARY_EDITABLE:
-                    self._handle_node_editable(node, graph_info)
-                    # Need a temporary package revision for package_revision_mode
-                    # Cannot be PREV_UNKNOWN otherwise the consumers can't compute their packageID
-                    node.prev = "editable"
-                else:
-                    if node.binary == BINARY_SKIP:  # Privates not necessary
-                        continue
-                    assert ref.revision is not None, "Installer should receive RREV always"
-                    if node.binary == BINARY_UNKNOWN:
-                        self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
-                    _handle_system_requirements(conan_file, node.pref, self._cache, output)
-                    self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+        try:
+            parallel = self._cache.config.parallel_build
+            if parallel and parallel > 1 and hasattr(os, "fork"):
+                self._out.info("Building binary packages in %s parallel jobs" % parallel)
+                self._build_scheduled(nodes_by_level, keep_build, graph_info, remotes,
+                                      build_mode, update, processed_package_refs, parallel)
+            else:
+                for level in nodes_by_level:
+                    for node in level:
+                        if self._prepare_node(node, graph_info, remotes, build_mode, update):
+                            self._handle_node_cache(node, keep_build, processed_package_refs,
+                                                    remotes)
+        except BaseException:
+            self._finish_downloads(terminate=True)
+            raise
+        self._finish_downloads(terminate=False)
 
         # Finally, propagate information to root node (ref=None)
         self._propagate_info(root_node, using_build_profile)
 
+    def _prepare_node(self, node, graph_info, remotes, build_mode, update):
+        """ propagates the upstream information to the node, and returns True if the node
+        binary has to be processed (built, downloaded or package_info() called)
+        """
+        ref, conan_file = node.ref, node.conanfile
+        self._propagate_info(node, bool(graph_info.profile_build))
+        if node.binary == BINARY_EDITABLE:
+            self._handle_node_editable(node, graph_info)
+            # Need a temporary package revision for package_revision_mode
+            # Cannot be PREV_UNKNOWN otherwise the consumers can't compute their packageID
+            node.prev = "editable"
+            return False
+        if node.binary == BINARY_SKIP:  # Privates not necessary
+            return False
+        assert ref.revision is not None, "Installer should receive RREV always"
+        if node.binary == BINARY_UNKNOWN:
+            self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
+        _handle_system_requirements(conan_file, node.pref, self._cache, conan_file.output)
+        return True
+
+    def _build_scheduled(self, nodes_by_level, keep_build, graph_info, remotes, build_mode,
+                         update, processed_package_refs, jobs):
+        """ Every node is processed as soon as all its dependencies are done, without waiting
+        for the rest of its level. Packages to build are built concurrently, up to "jobs", each
+        one in a forked process (builds chdir and change the environment, they cannot run in
+        threads), while the rest of nodes (cache, download, package_info()) are processed in
+        this process. The output of each build is buffered and printed when it finishes
+        """
+        pending = [node for level in nodes_by_level for node in level]
+        done = set()
+        running = {}  # {read_fd: _BuildJob}
+        building = {}  # {pref: _BuildJob}
+        error = None
+        while pending or running:
+            progress = False
+            for node in list(pending):
+                if error is not None:
+                    break
+                if any(dep.dst not in done for dep in node.dependencies):
+                    continue
+                pref = node.pref
+                to_build = (node.binary in (BINARY_BUILD, BINARY_UNKNOWN) and
+                            pref not in processed_package_refs)
+                if to_build and len(running) >= jobs:
+                    continue
+                pending.remove(node)
+                progress = True
+                if not self._prepare_node(node, graph_info, remotes, build_mode, update):
+                    done.add(node)
+                    continue
+                pref = node.pref  # Might have changed if it was BINARY_UNKNOWN
+                if node.binary == BINARY_BUILD and pref in building:
+                    building[pref].waiting.append(node)
+                elif node.binary == BINARY_BUILD and pref not in processed_package_refs:
+                    processed_package_refs.add(pref)
+                    job = self._fork_build(node, keep_build, remotes)
+                    running[job.read_fd] = job
+                    building[pref] = job
+                else:
+                    self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+                    done.add(node)
+
+            if progress or not running:
+                if not progress and pending and error is None:
+                    raise ConanException("Cannot schedule the build of: %s"
+                                         % ", ".join(str(n.ref) for n in pending))
+                if error is not None and not running:
+                    break
+                continue
+
+            readable, _, _ = select.select(list(running), [], [])
+            for read_fd in readable:
+                job = running[read_fd]
+                if job.read():
+                    continue
+                del running[read_fd]
+                del building[job.node.pref]
+                try:
+                    self._finish_build(job)
+                except Exception:
+                    # Wait for the other running builds before raising the first error
+                    if error is None:
+                        error = sys.exc_info()
+                else:
+                    done.add(job.node)
+                    done.update(job.waiting)
+
+        if error is not None:
+            six.reraise(*error)
+
+    def _fork_build(self, node, keep_build, remotes):
+        self._out.flush()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid:
+            os.close(write_fd)
+            node.conanfile.output.info("Building package in parallel job (pid %s)" % pid)
+            return _BuildJob(node, pid, read_fd)
+
+        # Child process: build the package, send the results to the parent and exit
+        os.close(read_fd)
+        output = BufferedOutput()
+        recorder = _BuildRecorderBuffer()
+        try:
+            with capture_thread_output(output):
+                try:
+                    conanfile = node.conanfile
+                    layout = self._cache.package_layout(node.pref.ref, conanfile.short_paths)
+                    with layout.package_lock(node.pref):
+                        with set_dirty_context_manager(layout.package(node.pref)):
+                            self._build_package(node, conanfile.output, keep_build, remotes,
+                                                recorder)
+                    result = {"prev": node.prev,
+                              "recipe_hash": conanfile.info.recipe_hash}
+                except Exception as e:
+                    result = {"error": str(e),
+                              "user_error": isinstance(e, ConanExceptionInUserConanfileMethod)}
+            data = pickle.dumps((output.chunks, recorder.calls, result), protocol=2)
+            with os.fdopen(write_fd, "wb") as f:
+                f.write(data)
+        finally:
+            os._exit(0)
+
+    def _finish_build(self, job):
+        node = job.node
+        chunks, recorder_calls, result = job.result()
+        output = BufferedOutput()
+        output.chunks = chunks
+        output.replay(self._out)
+        for method, args in recorder_calls:
+            getattr(self._recorder, method)(*args)
+        if "error" in result:
+            if result["user_error"]:
+                raise ConanExceptionInUserConanfileMethod(result["error"])
+            raise ConanException(result["error"])
+
+        node.prev = result["prev"]
+        node.conanfile.info.recipe_hash = result["recipe_hash"]
+        if node.graph_lock_node:
+            node.graph_lock_node.modified = GraphLockNode.MODIFIED_BUILT
+        for n in [node] + job.waiting:
+            layout = self._cache.package_layout(n.ref, n.conanfile.short_paths)
+            with layout.package_lock(n.pref):
+                self._node_package_info(n, layout.package(n.pref))
+
     def _handle_node_editable(self, node, graph_info):
         # Get source of information
         package_layout = self._cache.package_layout(node.ref)
@@ -465,6 +688,7 @@ class BinaryInstaller(object):
         layout = self._cache.package_layout(pref.ref, conanfile.short_paths)
         package_folder = layout.package(pref)
 
+        self._wait_download(pref)
         with layout.package_lock(pref):
             if pref not in processed_package_references:
                 processed_package_references.add(pref)
@@ -484,11 +708,15 @@ class BinaryInstaller(object):
                     log_package_got_from_local_cache(pref)
                     self._recorder.package_fetched_from_cache(pref)
 
-            # Call the info method
-            self._call_package_info(conanfile, package_folder, ref=pref.ref)
-            self._recorder.package_cpp_info(pref, conanfile.cpp_info)
+            self._node_package_info(node, package_folder)
+
+    def _node_package_info(self, node, package_folder):
+        # Call the info method
+        pref = node.pref
+        self._call_package_info(node.conanfile, package_folder, ref=pref.ref)
+        self._recorder.package_cpp_info(pref, node.conanfile.cpp_info)
 
-    def _build_package(self, node, output, keep_build, remotes):
+    def _build_package(self, node, output, keep_build, remotes, recorder=None):
         conanfile = node.conanfile
         # It is necessary to complete the sources of python requires, which might be used
         # Only the legacy python_requires allow this
@@ -501,7 +729,7 @@ class BinaryInstaller(object):
                                         python_require.conanfile, python_require.ref, remotes)
 
         builder = _PackageBuilder(self._cache, output, self._hook_manager, self._remote_manager)
-        pref = builder.build_package(node, keep_build, self._recorder, remotes)
+        pref = builder.build_package(node, keep_build, recorder or self._recorder, remotes)
         if node.graph_lock_node:
             node.graph_lock_node.modified = GraphLockNode.MODIFIED_BUILT
         return pref
@@ -1,10 +1,12 @@
 import fnmatch
 import imp
 import inspect
+import marshal
 import os
 import sys
 import uuid
 
+import six
 import yaml
 
 from conans.client.generators import registered_generators
@@ -20,14 +22,16 @@ from conans.model.settings import Settings
 from conans.model.values import Values
 from conans.paths import DATA_YML
 from conans.util.conan_v2_mode import CONAN_V2_MODE_ENVVAR
-from conans.util.files import load
+from conans.util.files import load, mkdir
+from conans.util.sha import sha256
 
 
 class ConanFileLoader(object):
-    def __init__(self, runner, output, python_requires, pyreq_loader=None):
+    def __init__(self, runner, output, python_requires, pyreq_loader=None, bytecode_folder=None):
         self._runner = runner
         self._output = output
         self._pyreq_loader = pyreq_loader
+        self._bytecode_folder = bytecode_folder
         self._python_requires = python_requires
         sys.modules["conans"].python_requires = python_requires
         self._cached_conanfile_classes = {}
@@ -51,7 +55,8 @@ class ConanFileLoader(object):
             self._python_requires.locked_versions = {r.name: r for r in lock_python_requires}
         try:
             self._python_requires.valid = True
-            module, conanfile = parse_conanfile(conanfile_path, self._python_requires)
+            module, conanfile = parse_conanfile(conanfile_path, self._python_requires,
+                                                self._bytecode_folder)
             self._python_requires.valid = False
 
             self._python_requires.locked_versions = None
@@ -311,9 +316,9 @@ def _parse_module(conanfile_module, module_id):
     return result
 
 
-def parse_conanfile(conanfile_path, python_requires):
+def parse_conanfile(conanfile_path, python_requires, bytecode_folder=None):
     with python_requires.capture_requires() as py_requires:
-        module, filename = _parse_conanfile(conanfile_path)
+        module, filename = _parse_conanfile(conanfile_path, bytecode_folder)
         try:
             conanfile = _parse_module(module, filename)
 
@@ -335,7 +340,59 @@ def parse_conanfile(conanfile_path, python_requires):
             raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
 
-def _parse_conanfile(conan_file_path):
+def _compile_conanfile(conan_file_path, bytecode_folder):
+    """ Compiles the python file, reusing the code compiled the previous time if it didn't change.
+    The bytecode_folder keeps one file for every conanfile path and interpreter, with the sha256
+    of the source it was compiled from, followed by the marshalled code
+    """
+    with open(conan_file_path, "rb") as handle:
+        source = handle.read()
+    if not bytecode_folder:
+        return compile(source, conan_file_path, "exec", dont_inherit=True)
+
+    # The code contains the path, for the tracebacks, and depends on the interpreter version
+    key = "%s\n%s" % (sys.version, conan_file_path)
+    bytecode_path = os.path.join(bytecode_folder, sha256(key.encode("utf-8")))
+    source_hash = sha256(source).encode()
+    try:
+        with open(bytecode_path, "rb") as handle:
+            bytecode = handle.read()
+        if bytecode[:len(source_hash)] == source_hash:
+            return marshal.loads(bytecode[len(source_hash):])
+    except (IOError, OSError, EOFError, ValueError, TypeError):  # Not cached yet or corrupted
+        pass
+
+    code = compile(source, conan_file_path, "exec", dont_inherit=True)
+    tmp_path = "%s.%s" % (bytecode_path, uuid.uuid4())
+    try:
+        mkdir(bytecode_folder)
+        with open(tmp_path, "wb") as handle:
+            handle.write(source_hash + marshal.dumps(code))
+        if os.path.exists(bytecode_path):  # Windows doesn't replace on rename
+            os.remove(bytecode_path)
+        os.rename(tmp_path, bytecode_path)
+    except (IOError, OSError):  # Read only cache or written concurrently, just not cached
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return code
+
+
+def _load_source(module_id, conan_file_path, bytecode_folder):
+    """ Equivalent to imp.load_source(), with the code from _compile_conanfile()
+    """
+    code = _compile_conanfile(conan_file_path, bytecode_folder)
+    module = imp.new_module(module_id)
+    module.__file__ = conan_file_path
+    sys.modules[module_id] = module
+    try:
+        six.exec_(code, module.__dict__)
+    except BaseException:
+        del sys.modules[module_id]
+        raise
+    return module
+
+
+def _parse_conanfile(conan_file_path, bytecode_folder=None):
     """ From a given path, obtain the in memory python import module
     """
 
@@ -349,7 +406,7 @@ def _parse_conanfile(conan_file_path):
         old_modules = list(sys.modules.keys())
         with chdir(current_dir):
             sys.dont_write_bytecode = True
-            loaded = imp.load_source(module_id, conan_file_path)
+            loaded = _load_source(module_id, conan_file_path, bytecode_folder)
             sys.dont_write_bytecode = False
 
         # These lines are necessary, otherwise local conanfile imports with same name
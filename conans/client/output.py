@@ -1,6 +1,9 @@
 import os
 import six
 import sys
+import threading
+from contextlib import contextmanager
+
 from colorama import Fore, Style
 
 from conans.util.env_reader import get_env
@@ -56,6 +59,14 @@ if get_env("CONAN_COLOR_DARK", 0):
     Color.BRIGHT_GREEN = Fore.GREEN
 
 
+_thread_capture = threading.local()
+
+
+def _captured_output(output):
+    capture = getattr(_thread_capture, "output", None)
+    return capture if capture is not None and capture is not output else None
+
+
 class ConanOutput(object):
     """ wraps an output stream, so it can be pretty colored,
     and auxiliary info, success, warn methods for convenience.
@@ -68,6 +79,9 @@ class ConanOutput(object):
 
     @property
     def is_terminal(self):
+        capture = _captured_output(self)
+        if capture is not None:
+            return capture.is_terminal
         return hasattr(self._stream, "isatty") and self._stream.isatty()
 
     def writeln(self, data, front=None, back=None, error=False):
@@ -84,6 +98,11 @@ class ConanOutput(object):
         self._stream_err.write(data)
 
     def write(self, data, front=None, back=None, newline=False, error=False):
+        capture = _captured_output(self)
+        if capture is not None:
+            capture.write(data, front=front, back=back, newline=newline, error=error)
+            return
+
         if six.PY2:
             if isinstance(data, str):
                 data = decode_text(data)  # Keep python 2 compatibility
@@ -127,6 +146,10 @@ class ConanOutput(object):
         self.write(data, Color.GREEN)
 
     def rewrite_line(self, line):
+        capture = _captured_output(self)
+        if capture is not None:
+            capture.rewrite_line(line)
+            return
         tmp_color = self._color
         self._color = False
         TOTAL_SIZE = 70
@@ -154,3 +177,59 @@ class ScopedOutput(ConanOutput):
                                         newline=False, error=error)
         super(ScopedOutput, self).write("%s" % data, front=Color.BRIGHT_WHITE, back=back,
                                         newline=newline, error=error)
+
+
+
+class BufferedOutput(ConanOutput):
+    """ Output that keeps in memory everything written to it, preserving the order of
+    the normal and error messages, so it can be replayed later into another output. Used
+    by concurrent tasks, so their messages do not get interleaved
+    """
+
+    def __init__(self):
+        super(BufferedOutput, self).__init__(None)
+        self.chunks = []
+
+    @property
+    def is_terminal(self):
+        return False
+
+    def write(self, data, front=None, back=None, newline=False, error=False):
+        self.chunks.append(("write", (data, front, back, newline, error)))
+
+    def rewrite_line(self, line):
+        self.chunks.append(("rewrite_line", (line, )))
+
+    def flush(self):
+        pass
+
+    def replay(self, output):
+        for method, args in self.chunks:
+            getattr(output, method)(*args)
+        del self.chunks[:]
+
+
+@contextmanager
+def capture_thread_output(output):
+    """ While active, everything written by any ConanOutput from the current thread goes
+    to the given output instead (typically a BufferedOutput), including the messages of the
+    remote and hooks layers that hold their own output instance
+    """
+    previous = getattr(_thread_capture, "output", None)
+    _thread_capture.output = output
+    try:
+        yield
+    finally:
+        _thread_capture.output = previous
+
+
+def inherit_thread_output(func):
+    """ Wraps func so, when run by a helper thread, its output goes to the same capture (if any)
+    that the thread creating the wrapper has
+    """
+    capture = getattr(_thread_capture, "output", None)
+
+    def wrapper(*args, **kwargs):
+        with capture_thread_output(capture):
+            return func(*args, **kwargs)
+    return wrapper
@@ -7,7 +7,7 @@ from conans.util.files import mkdir, save
 
 
 def export_pkg(conanfile, package_id, src_package_folder, package_folder, hook_manager,
-               conanfile_path, ref):
+               conanfile_path, ref, hash_cache=None):
     mkdir(package_folder)
     conanfile.package_folder = package_folder
     output = conanfile.output
@@ -24,7 +24,7 @@ def export_pkg(conanfile, package_id, src_package_folder, package_folder, hook_m
                          reference=ref, package_id=package_id)
 
     save(os.path.join(package_folder, CONANINFO), conanfile.info.dumps())
-    manifest = FileTreeManifest.create(package_folder)
+    manifest = FileTreeManifest.create(package_folder, hash_cache=hash_cache)
     manifest.save(package_folder)
     report_files_from_manifest(output, manifest)
 
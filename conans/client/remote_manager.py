@@ -48,6 +48,7 @@ class RemoteManager(object):
         assert ref.revision, "upload_recipe requires RREV"
         self._call_remote(remote, "upload_recipe", ref, files_to_upload, deleted,
                           retry, retry_wait)
+        self._cache.range_index.invalidate(ref)
 
     def upload_package(self, pref, files_to_upload, deleted, remote, retry, retry_wait):
         assert pref.ref.revision, "upload_package requires RREV"
@@ -118,7 +119,7 @@ class RemoteManager(object):
         log_recipe_sources_download(ref, duration, remote.name, zipped_files)
 
         unzip_and_get_files(zipped_files, export_sources_folder, EXPORT_SOURCES_TGZ_NAME,
-                            output=self._output)
+                            output=self._output, parallel=self._cache.config.parallel_extraction)
         # REMOVE in Conan 2.0
         c_src_path = os.path.join(export_sources_folder, EXPORT_SOURCES_DIR_OLD)
         if os.path.exists(c_src_path):
@@ -150,7 +151,8 @@ class RemoteManager(object):
 
             duration = time.time() - t1
             log_package_download(pref, duration, remote, zipped_files)
-            unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME, output=self._output)
+            unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME, output=self._output,
+                                parallel=self._cache.config.parallel_extraction)
             # Issue #214 https://github.com/conan-io/conan/issues/214
             touch_folder(dest_folder)
             if get_env("CONAN_READ_ONLY_CACHE", False):
@@ -186,7 +188,9 @@ class RemoteManager(object):
         return packages
 
     def remove_recipe(self, ref, remote):
-        return self._call_remote(remote, "remove_recipe", ref)
+        result = self._call_remote(remote, "remove_recipe", ref)
+        self._cache.range_index.invalidate(ref)
+        return result
 
     def remove_packages(self, ref, remove_ids, remote):
         return self._call_remote(remote, "remove_packages", ref, remove_ids)
@@ -273,23 +277,23 @@ def check_compressed_files(tgz_name, files):
                                  "Please upgrade conan client." % f)
 
 
-def unzip_and_get_files(files, destination_dir, tgz_name, output):
+def unzip_and_get_files(files, destination_dir, tgz_name, output, parallel=None):
     """Moves all files from package_files, {relative_name: tmp_abs_path}
     to destination_dir, unzipping the "tgz_name" if found"""
 
     tgz_file = files.pop(tgz_name, None)
     check_compressed_files(tgz_name, files)
     if tgz_file:
-        uncompress_file(tgz_file, destination_dir, output=output)
+        uncompress_file(tgz_file, destination_dir, output=output, parallel=parallel)
         os.remove(tgz_file)
 
 
-def uncompress_file(src_path, dest_folder, output):
+def uncompress_file(src_path, dest_folder, output, parallel=None):
     t1 = time.time()
     try:
         with progress_bar.open_binary(src_path, output, "Decompressing %s" % os.path.basename(
                 src_path)) as file_handler:
-            tar_extract(file_handler, dest_folder)
+            tar_extract(file_handler, dest_folder, parallel=parallel)
     except Exception as e:
         error_msg = "Error while downloading/extracting files to %s\n%s\n" % (dest_folder, str(e))
         # try to remove the files
@@ -4,7 +4,7 @@ from conans.client.cache.remote_registry import Remote
 from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
 from conans.errors import NotFoundException
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
-from conans.paths import SYSTEM_REQS, rm_conandir
+from conans.paths import PACKAGES_FOLDER, SYSTEM_REQS, rm_conandir
 from conans.search.search import filter_outdated, search_packages, search_recipes
 from conans.util.log import logger
 
@@ -32,6 +32,7 @@ class DiskRemover(object):
         self.remove_src(package_layout)
         self._remove(package_layout.export(), package_layout.ref, "export folder")
         self._remove(package_layout.export_sources(), package_layout.ref, "export_source folder")
+        self._remove_file(package_layout.recipe_hashes(), package_layout.ref, "recipe hashes")
         for f in package_layout.conanfile_lock_files(output=output):
             try:
                 os.remove(f)
@@ -70,6 +71,8 @@ class DiskRemover(object):
                              "package folder:%s" % package)
             self._remove(path, package_layout.ref, "packages")
             self._remove_file(package_layout.system_reqs(), package_layout.ref, SYSTEM_REQS)
+            self._remove(os.path.join(package_layout.hashes(), PACKAGES_FOLDER),
+                         package_layout.ref, "packages hashes")
         else:
             for id_ in ids_filter:  # remove just the specified packages
                 pref = PackageReference(package_layout.ref, id_)
@@ -78,6 +81,8 @@ class DiskRemover(object):
                 pkg_folder = package_layout.package(pref)
                 self._remove(pkg_folder, package_layout.ref, "package:%s" % id_)
                 self._remove_file(pkg_folder + ".dirty", package_layout.ref, "dirty flag")
+                self._remove_file(package_layout.package_hashes(pref), package_layout.ref,
+                                  "%s hashes" % id_)
                 self._remove_file(package_layout.system_reqs_package(pref), package_layout.ref,
                                   "%s/%s" % (id_, SYSTEM_REQS))
 
@@ -129,6 +134,7 @@ class ConanRemover(object):
 
         if not src and build_ids is None and package_ids is None:
             remover.remove(package_layout, output=self._user_io.out)
+            self._cache.range_index.invalidate(ref)
 
     def remove(self, pattern, remote_name, src=None, build_ids=None, package_ids_filter=None,
                force=False, packages_query=None, outdated=False):
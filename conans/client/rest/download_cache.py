@@ -1,4 +1,6 @@
+import json
 import os
+import platform
 import shutil
 from threading import Lock
 
@@ -6,12 +8,18 @@ from six.moves.urllib_parse import urlsplit, urlunsplit
 
 from conans.client.tools.files import check_md5, check_sha1, check_sha256
 from conans.errors import ConanException
-from conans.util.files import mkdir
+from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.util.files import load, mkdir, save, sha256sum
 from conans.util.locks import SimpleLock
 from conans.util.sha import sha256 as sha256_sum
 
 
 class CachedFileDownloader(object):
+    """ Downloads files through a content addressed cache, shared by all the remotes:
+
+    - "blobs/<sha256 of contents>": the downloaded files, only one copy for identical contents
+    - "index/<sha256 of url>": the sha256 of the contents that url returned
+    """
     _thread_locks = {}  # Needs to be shared among all instances
 
     def __init__(self, cache_folder, file_downloader, user_download=False):
@@ -37,22 +45,17 @@ class CachedFileDownloader(object):
         assert (not self._user_download) or (self._user_download and checksum)
         h = self._get_hash(url, checksum)
         lock = os.path.join(self._cache_folder, "locks", h)
-        cached_path = os.path.join(self._cache_folder, h)
         with SimpleLock(lock):
             # Once the process has access, make sure multithread is locked too
             # as SimpleLock doesn't work multithread
             thread_lock = self._thread_locks.setdefault(lock, Lock())
             thread_lock.acquire()
             try:
-                if not os.path.exists(cached_path):
-                    try:
-                        self._file_downloader.download(url, cached_path, auth, retry, retry_wait,
-                                                       overwrite, headers)
-                        self._check_checksum(cached_path, md5, sha1, sha256)
-                    except Exception:
-                        if os.path.exists(cached_path):
-                            os.remove(cached_path)
-                        raise
+                cached_path = self._cached_path(h)
+                if cached_path is None:
+                    cached_path = self._download_blob(h, url, auth, retry, retry_wait, overwrite,
+                                                      headers, md5, sha1, sha256)
+                    hit = False
                 else:
                     # specific check for corrupted cached files, will raise, but do nothing more
                     # user can report it or "rm -rf cache_folder/path/to/file"
@@ -61,11 +64,19 @@ class CachedFileDownloader(object):
                     except ConanException as e:
                         raise ConanException("%s\nCached downloaded file corrupted: %s"
                                              % (str(e), cached_path))
+                    os.utime(cached_path, None)  # Recently used, the last to be pruned
+                    hit = True
+                DownloadCacheStats(self._cache_folder).update(hit, os.path.getsize(cached_path))
 
                 if file_path is not None:
                     file_path = os.path.abspath(file_path)
                     mkdir(os.path.dirname(file_path))
-                    shutil.copy2(cached_path, file_path)
+                    # The compressed artifacts are only read and removed, they can share the
+                    # cached file, any other file can be modified
+                    link = (not self._user_download and
+                            os.path.basename(file_path) in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME,
+                                                            EXPORT_SOURCES_TGZ_NAME))
+                    _materialize(cached_path, file_path, link)
                 else:
                     with open(cached_path, 'rb') as handle:
                         tmp = handle.read()
@@ -73,6 +84,50 @@ class CachedFileDownloader(object):
             finally:
                 thread_lock.release()
 
+    def _cached_path(self, h):
+        """ the blob of a previously downloaded url, None if not cached
+        """
+        index_path = os.path.join(self._cache_folder, "index", h)
+        if os.path.isfile(index_path):
+            blob_path = os.path.join(self._cache_folder, "blobs", load(index_path).strip())
+            if os.path.isfile(blob_path):
+                return blob_path
+        # Files cached with the previous layout, directly named by url hash
+        old_path = os.path.join(self._cache_folder, h)
+        if os.path.isfile(old_path):
+            return self._store_blob(h, old_path)
+
+    def _download_blob(self, h, url, auth, retry, retry_wait, overwrite, headers, md5, sha1,
+                       sha256):
+        tmp_path = os.path.join(self._cache_folder, "blobs", "%s.tmp" % h)
+        if os.path.exists(tmp_path):  # From an interrupted download
+            os.remove(tmp_path)
+        try:
+            self._file_downloader.download(url, tmp_path, auth, retry, retry_wait, overwrite,
+                                           headers)
+            self._check_checksum(tmp_path, md5, sha1, sha256)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return self._store_blob(h, tmp_path)
+
+    def _store_blob(self, h, path):
+        content_hash = sha256sum(path)
+        blob_path = os.path.join(self._cache_folder, "blobs", content_hash)
+        if os.path.exists(blob_path):  # Same contents from another url
+            os.remove(path)
+        else:
+            mkdir(os.path.dirname(blob_path))
+            try:
+                os.rename(path, blob_path)
+            except OSError:  # Other process stored the same contents meanwhile
+                if not os.path.exists(blob_path):
+                    raise
+                os.remove(path)
+        save(os.path.join(self._cache_folder, "index", h), content_hash)
+        return blob_path
+
     def _get_hash(self, url, checksum=None):
         """ For Api V2, the cached downloads always have recipe and package REVISIONS in the URL,
         making them immutable, and perfect for cached downloads of artifacts. For V2 checksum
@@ -89,3 +144,117 @@ class CachedFileDownloader(object):
             url += checksum
         h = sha256_sum(url.encode())
         return h
+
+
+def _reflink(src, dst):
+    """ copy-on-write clone of the file, for the filesystems supporting it (btrfs, xfs...)
+    """
+    if platform.system() != "Linux":
+        return False
+    import fcntl
+    ficlone = 0x40049409
+    try:
+        with open(src, "rb") as src_handle, open(dst, "wb") as dst_handle:
+            fcntl.ioctl(dst_handle.fileno(), ficlone, src_handle.fileno())
+    except (IOError, OSError):
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _materialize(cached_path, file_path, link):
+    if os.path.lexists(file_path):  # Never write through a previous link to the cache
+        os.remove(file_path)
+    if _reflink(cached_path, file_path):
+        return
+    if link:
+        try:
+            os.link(cached_path, file_path)
+            return
+        except (OSError, AttributeError):  # Other device, no filesystem support, py2 Windows
+            pass
+    shutil.copy2(cached_path, file_path)
+
+
+class DownloadCacheStats(object):
+    """ hits and misses of a download cache folder, shared by all the processes using it
+    """
+    _thread_lock = Lock()
+
+    def __init__(self, cache_folder):
+        self._stats_path = os.path.join(cache_folder, "stats.json")
+        self._lock_path = os.path.join(cache_folder, "locks", "stats")
+
+    def load(self):
+        try:
+            return json.loads(load(self._stats_path))
+        except (IOError, OSError, ValueError):
+            return {"hits": 0, "misses": 0, "hit_bytes": 0, "miss_bytes": 0}
+
+    def update(self, hit, size):
+        # SimpleLock doesn't work multithread, the threads of this process are locked too
+        with SimpleLock(self._lock_path), self._thread_lock:
+            stats = self.load()
+            if hit:
+                stats["hits"] += 1
+                stats["hit_bytes"] += size
+            else:
+                stats["misses"] += 1
+                stats["miss_bytes"] += size
+            save(self._stats_path, json.dumps(stats))
+
+
+def download_cache_info(cache_folder):
+    """ contents and statistics of the download cache
+    """
+    blobs = _blobs(cache_folder)
+    index_folder = os.path.join(cache_folder, "index")
+    urls = len(os.listdir(index_folder)) if os.path.isdir(index_folder) else 0
+    result = DownloadCacheStats(cache_folder).load()
+    result.update({"files": len(blobs), "urls": urls,
+                   "size": sum(size for _, size, _ in blobs)})
+    return result
+
+
+def _blobs(cache_folder):
+    """ [(path, size, last used time)] of all the cached files
+    """
+    blobs_folder = os.path.join(cache_folder, "blobs")
+    if not os.path.isdir(blobs_folder):
+        return []
+    result = []
+    for name in os.listdir(blobs_folder):
+        if name.endswith(".tmp"):
+            continue
+        path = os.path.join(blobs_folder, name)
+        st = os.stat(path)
+        result.append((path, st.st_size, st.st_mtime))
+    return result
+
+
+def prune_download_cache(cache_folder, max_size):
+    """ Removes the least recently used files until the cache is not bigger than max_size bytes,
+    and the urls pointing to them
+    :return: (number of removed files, removed bytes)
+    """
+    blobs = sorted(_blobs(cache_folder), key=lambda b: b[2])
+    total = sum(size for _, size, _ in blobs)
+    removed, removed_size = 0, 0
+    for path, size, _ in blobs:
+        if total <= max_size:
+            break
+        os.remove(path)
+        total -= size
+        removed += 1
+        removed_size += size
+
+    index_folder = os.path.join(cache_folder, "index")
+    if removed and os.path.isdir(index_folder):
+        blobs_folder = os.path.join(cache_folder, "blobs")
+        for name in os.listdir(index_folder):
+            index_path = os.path.join(index_folder, name)
+            if not os.path.exists(os.path.join(blobs_folder, load(index_path).strip())):
+                os.remove(index_path)
+    return removed, removed_size
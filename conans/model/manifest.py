@@ -1,12 +1,15 @@
 import calendar
 import datetime
+import json
 import os
 import time
+from multiprocessing.pool import ThreadPool
 
+from conans.client.tools.oss import cpu_count
 from conans.errors import ConanException
 from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
 from conans.util.env_reader import get_env
-from conans.util.files import load, md5, md5sum, save, walk
+from conans.util.files import load, md5, md5sum, racy_stat_time, save, stat_key, walk
 
 
 def discarded_file(filename):
@@ -48,6 +51,55 @@ def gather_files(folder):
     return file_dict, symlinks
 
 
+def md5sums(files, hash_cache=None):
+    """ computes the md5 of the {name: filepath} files, in parallel. If hash_cache, the path of
+    a json file storing the previous results, the files with the same size, modification and
+    change times and inode are not read again
+    :return: {name: md5}
+    """
+    previous = {}
+    if hash_cache:
+        try:
+            previous = json.loads(load(hash_cache))
+        except (IOError, OSError, ValueError):  # Not computed yet or corrupted, start again
+            pass
+
+    racy_time = racy_stat_time()
+    result = {}
+    entries = {}  # {name: [size, mtime_ns, ctime_ns, inode, md5]}
+    missing = []
+    for name, filepath in files.items():
+        key = stat_key(filepath)  # Before reading, a modification meanwhile changes it
+        entry = previous.get(name)
+        if entry and entry[:4] == key:
+            result[name] = entry[4]
+            entries[name] = entry
+        else:
+            missing.append((name, filepath, key))
+
+    if len(missing) > 1:
+        pool = ThreadPool(min(cpu_count(), len(missing)))
+        try:
+            sums = pool.map(md5sum, [filepath for _, filepath, _ in missing])
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        sums = [md5sum(filepath) for _, filepath, _ in missing]
+
+    for (name, _, key), file_md5 in zip(missing, sums):
+        result[name] = file_md5
+        if key[1] < racy_time:
+            entries[name] = key + [file_md5]
+
+    if hash_cache and entries != previous:
+        try:
+            save(hash_cache, json.dumps(entries))
+        except (IOError, OSError):  # Read only cache, the next time will read them again
+            pass
+    return result
+
+
 class FileTreeManifest(object):
 
     def __init__(self, the_time, file_sums):
@@ -110,22 +162,21 @@ class FileTreeManifest(object):
         save(path, repr(self))
 
     @classmethod
-    def create(cls, folder, exports_sources_folder=None):
+    def create(cls, folder, exports_sources_folder=None, hash_cache=None):
         """ Walks a folder and create a FileTreeManifest for it, reading file contents
-        from disk, and capturing current time
+        from disk, and capturing current time. The files not modified since the previous
+        call with the same hash_cache file are not read again
         """
         files, _ = gather_files(folder)
         for f in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME):
             files.pop(f, None)
 
-        file_dict = {}
-        for name, filepath in files.items():
-            file_dict[name] = md5sum(filepath)
-
         if exports_sources_folder:
             export_files, _ = gather_files(exports_sources_folder)
             for name, filepath in export_files.items():
-                file_dict["export_source/%s" % name] = md5sum(filepath)
+                files["export_source/%s" % name] = filepath
+
+        file_dict = md5sums(files, hash_cache)
 
         date = calendar.timegm(time.gmtime())
 
@@ -49,6 +49,7 @@ EXPORT_SOURCES_DIR_OLD = ".c_src"
 RUN_LOG_NAME = "conan_run.log"
 DEFAULT_PROFILE_NAME = "default"
 PACKAGE_METADATA = "metadata.json"
+PACKAGES_INDEX = "packages_index.json"
 CACERT_FILE = "cacert.pem"  # Server authorities file
 DATA_YML = "conandata.yml"
 
@@ -60,3 +61,4 @@ BUILD_FOLDER = "build"
 PACKAGES_FOLDER = "package"
 SYSTEM_REQS_FOLDER = "system_reqs"
 SCM_SRC_FOLDER = "scm_source"
+HASHES_FOLDER = "hashes"
@@ -16,7 +16,8 @@ from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference
 from conans.model.ref import PackageReference
 from conans.paths import CONANFILE, SYSTEM_REQS, EXPORT_FOLDER, EXPORT_SRC_FOLDER, SRC_FOLDER, \
-    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER
+    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, \
+    HASHES_FOLDER, PACKAGES_INDEX
 from conans.util.files import load, save, rmdir
 from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
 from conans.util.log import logger
@@ -113,13 +114,31 @@ class PackageCacheLayout(object):
     def package_metadata(self):
         return os.path.join(self._base_folder, PACKAGE_METADATA)
 
+    def packages_index(self):
+        """ settings and options of the packages, to search them without parsing their
+        conaninfo.txt every time """
+        return os.path.join(self._base_folder, PACKAGES_INDEX)
+
+    def hashes(self):
+        return os.path.join(self._base_folder, HASHES_FOLDER)
+
+    def recipe_hashes(self):
+        """ hash cache of the export and export_source folders files, for the manifest """
+        return os.path.join(self._base_folder, HASHES_FOLDER, EXPORT_FOLDER)
+
+    def package_hashes(self, pref):
+        """ hash cache of the package folder files, for the manifest """
+        assert isinstance(pref, PackageReference)
+        return os.path.join(self._base_folder, HASHES_FOLDER, PACKAGES_FOLDER, pref.id)
+
     def recipe_manifest(self):
         return FileTreeManifest.load(self.export())
 
     def package_manifests(self, pref):
         package_folder = self.package(pref)
         readed_manifest = FileTreeManifest.load(package_folder)
-        expected_manifest = FileTreeManifest.create(package_folder)
+        expected_manifest = FileTreeManifest.create(package_folder,
+                                                    hash_cache=self.package_hashes(pref))
         return readed_manifest, expected_manifest
 
     def recipe_exists(self):
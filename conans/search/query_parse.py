@@ -68,6 +68,34 @@ def evaluate_postfix(postfix, evaluator):
         return stack[0]
 
 
+def compile_postfix(postfix, compiler):
+    """
+    Translates a postfix expression to a function returning a bool, so it can be evaluated
+    many times without parsing it again
+    @param postfix:  Postfix expression as a list
+    @param compiler: Function receiving expressions like "compiler.version=12" and returning
+                     a function that receives the evaluated item and returns a bool
+    @return: function receiving the evaluated item
+    """
+    if not postfix:  # If no query return all?
+        return lambda item: True
+
+    stack = []
+    for el in postfix:
+        if not is_operator(el):
+            stack.append(compiler(el))
+        else:
+            o1 = stack.pop()
+            o2 = stack.pop()
+            if el == "|":
+                stack.append(lambda item, o1=o1, o2=o2: o1(item) or o2(item))
+            elif el == "&":
+                stack.append(lambda item, o1=o1, o2=o2: o1(item) and o2(item))
+    if len(stack) != 1:
+        raise Exception("Bad stack: %s" % str(postfix))
+    return stack[0]
+
+
 def infix_to_postfix(exp):
     """
     Translates an infix expression to postfix using an standard algorithm
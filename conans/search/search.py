@@ -1,3 +1,4 @@
+import json
 import os
 import re
 from collections import OrderedDict
@@ -7,8 +8,8 @@ from conans.errors import ConanException, RecipeNotFoundException
 from conans.model.info import ConanInfo
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import CONANINFO
-from conans.search.query_parse import evaluate_postfix, infix_to_postfix
-from conans.util.files import list_folder_subdirs, load
+from conans.search.query_parse import compile_postfix, infix_to_postfix
+from conans.util.files import list_folder_subdirs, load, racy_stat_time, save, stat_key
 from conans.util.log import logger
 
 
@@ -47,49 +48,38 @@ def filter_packages(query, package_infos):
         if " not " in query or query.startswith("not "):
             raise ConanException("'not' operator is not allowed")
         postfix = infix_to_postfix(query) if query else []
+        evaluate = compile_postfix(postfix, _compile_expression)
         result = OrderedDict()
         for package_id, info in package_infos.items():
-            if _evaluate_postfix_with_info(postfix, info):
+            if evaluate(info):
                 result[package_id] = info
         return result
     except Exception as exc:
         raise ConanException("Invalid package query: %s. %s" % (query, exc))
 
 
-def _evaluate_postfix_with_info(postfix, conan_vars_info):
-
-    # Evaluate conaninfo with the expression
-
-    def evaluate_info(expression):
-        """Receives an expression like compiler.version="12"
-        Uses conan_vars_info in the closure to evaluate it"""
-        name, value = expression.split("=", 1)
-        value = value.replace("\"", "")
-        return _evaluate(name, value, conan_vars_info)
-
-    return evaluate_postfix(postfix, evaluate_info)
-
-
-def _evaluate(prop_name, prop_value, conan_vars_info):
+def _compile_expression(expression):
     """
-    Evaluates a single prop_name, prop_value like "os", "Windows" against
-    conan_vars_info.serialize_min()
+    Receives an expression like compiler.version="12" and returns the function evaluating it
+    against a conan_vars_info.serialize_min()
     """
-
-    def compatible_prop(setting_value, _prop_value):
-        return (_prop_value == setting_value) or (_prop_value == "None" and setting_value is None)
-
-    info_settings = conan_vars_info.get("settings", [])
-    info_options = conan_vars_info.get("options", [])
+    prop_name, prop_value = expression.split("=", 1)
+    prop_value = prop_value.replace("\"", "")
     properties = ["os", "os_build", "compiler", "arch", "arch_build", "build_type"]
 
     def starts_with_common_settings(_prop_name):
         return any(_prop_name.startswith(setting + '.') for setting in properties)
 
     if prop_name in properties or starts_with_common_settings(prop_name):
-        return compatible_prop(info_settings.get(prop_name, None), prop_value)
+        column = "settings"
     else:
-        return compatible_prop(info_options.get(prop_name, None), prop_value)
+        column = "options"
+
+    def evaluate(conan_vars_info):
+        value = conan_vars_info.get(column, {}).get(prop_name, None)
+        return (prop_value == value) or (prop_value == "None" and value is None)
+
+    return evaluate
 
 
 def search_recipes(cache, pattern=None, ignorecase=True):
@@ -140,7 +130,19 @@ def search_packages(package_layout, query):
 
 
 def _get_local_infos_min(package_layout):
+    """ The conaninfo.txt of every package is parsed only once, and stored in the packages index
+    of the recipe while it is not modified. The index is checked against the files, so it is
+    always up to date, whatever created, downloaded or removed the packages
+    """
     result = OrderedDict()
+    index_path = package_layout.packages_index()
+    try:
+        index = json.loads(load(index_path))
+    except (IOError, OSError, ValueError):  # Not created yet or corrupted, start again
+        index = {}
+    new_index = {}  # {package_id: {"key": stat_key(conaninfo), "info": serialize_min()}}
+    racy_time = racy_stat_time()
+    metadata = package_layout.load_metadata() if package_layout.ref.revision else None
 
     packages_path = package_layout.packages()
     subdirs = list_folder_subdirs(packages_path, level=1)
@@ -151,15 +153,25 @@ def _get_local_infos_min(package_layout):
         if not os.path.exists(info_path):
             logger.error("There is no ConanInfo: %s" % str(info_path))
             continue
-        conan_info_content = load(info_path)
-
-        info = ConanInfo.loads(conan_info_content)
-        if package_layout.ref.revision:
-            metadata = package_layout.load_metadata()
+        key = stat_key(info_path)
+        entry = index.get(package_id)
+        if entry and entry["key"] == key:
+            conan_vars_info = entry["info"]
+        else:
+            conan_info_content = load(info_path)
+            conan_vars_info = ConanInfo.loads(conan_info_content).serialize_min()
+        if key[1] < racy_time:
+            new_index[package_id] = {"key": key, "info": conan_vars_info}
+
+        if metadata is not None:
             recipe_revision = metadata.packages[package_id].recipe_revision
             if recipe_revision and recipe_revision != package_layout.ref.revision:
                 continue
-        conan_vars_info = info.serialize_min()
         result[package_id] = conan_vars_info
 
+    if new_index != index:
+        try:
+            save(index_path, json.dumps(new_index))
+        except (IOError, OSError):  # Read only cache, just not indexed
+            pass
     return result
@@ -7,9 +7,10 @@ from threading import Thread
 
 from bottle import static_file, request
 
-from conans.client.rest.download_cache import CachedFileDownloader
+from conans.client.rest.download_cache import CachedFileDownloader, download_cache_info, \
+    prune_download_cache
 from conans.test.utils.test_files import temp_folder
-from conans.test.utils.tools import TestClient, StoppableThreadBottle
+from conans.test.utils.tools import GenConanfile, TestClient, StoppableThreadBottle
 from conans.util.env_reader import get_env
 from conans.util.files import load, save
 
@@ -37,8 +38,9 @@ class DownloadCacheTest(unittest.TestCase):
         client.run("install mypkg/0.1@user/testing")
         content = load(log_trace_file)
         self.assertEqual(6, content.count('"_action": "DOWNLOAD"'))
-        # 6 files cached, plus "locks" folder = 7
-        self.assertEqual(7, len(os.listdir(cache_folder)))
+        # 6 files cached
+        self.assertEqual(6, len(os.listdir(os.path.join(cache_folder, "index"))))
+        self.assertEqual(6, len(os.listdir(os.path.join(cache_folder, "blobs"))))
 
         os.remove(log_trace_file)
         client.run("remove * -f")
@@ -85,10 +87,9 @@ class DownloadCacheTest(unittest.TestCase):
         client.run('config set storage.download_cache="%s"' % cache_folder)
         client.run("remove * -f")
         client.run("install mypkg/0.1@user/testing")
-        for f in os.listdir(cache_folder):
-            f = os.path.join(cache_folder, f)
-            if not os.path.isfile(f):
-                continue
+        blobs_folder = os.path.join(cache_folder, "blobs")
+        for f in os.listdir(blobs_folder):
+            f = os.path.join(blobs_folder, f)
             save(f, load(f) + "a")
         client.run("remove * -f")
         client.run("install mypkg/0.1@user/testing", assert_error=True)
@@ -125,7 +126,8 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertIn("ConanException: md5 signature failed for", client.out)
         self.assertIn("Provided signature: kk", client.out)
         self.assertIn("Computed signature: 9893532233caff98cd083a116b013c0b", client.out)
-        self.assertEqual(1, len(os.listdir(cache_folder)))  # Nothing was cached
+        self.assertFalse(os.path.exists(os.path.join(cache_folder, "index")))  # Nothing cached
+        self.assertEqual([], os.listdir(os.path.join(cache_folder, "blobs")))
 
         # This is the right checksum
         conanfile = textwrap.dedent("""
@@ -146,8 +148,9 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertTrue(os.path.exists(local_path2))
         self.assertEqual("some query", client.load("myfile2.txt"))
 
-        # 2 files cached, plus "locks" folder = 3
-        self.assertEqual(3, len(os.listdir(cache_folder)))
+        # 2 files cached
+        self.assertEqual(2, len(os.listdir(os.path.join(cache_folder, "index"))))
+        self.assertEqual(2, len(os.listdir(os.path.join(cache_folder, "blobs"))))
 
         # remove remote file
         os.remove(file_path)
@@ -168,6 +171,38 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertIn("ERROR: conanfile.py: Error in source() method, line 7", client.out)
         self.assertIn("Not found: http://localhost", client.out)
 
+    def test_cache_command(self):
+        client = TestClient(default_server_user=True)
+        client.run("cache stats", assert_error=True)
+        self.assertIn("ERROR: There is no download cache, configure 'storage.download_cache' "
+                      "first", client.out)
+
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . mypkg/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        cache_folder = temp_folder()
+        client.run('config set storage.download_cache="%s"' % cache_folder)
+        client.run("remove * -f")
+        client.run("install mypkg/0.1@user/testing")
+        client.run("remove * -f")
+        client.run("install mypkg/0.1@user/testing")
+        client.run("cache stats")
+        # One of the manifests is requested twice by every install
+        self.assertIn("Files: 5 (5 urls)", client.out)
+        self.assertIn("Hits: 7", client.out)
+        self.assertIn("Misses: 5", client.out)
+        self.assertIn("Hit ratio: 58.3%", client.out)
+
+        client.run("cache prune 1G")
+        self.assertIn("Removed 0 files (0 B) from the download cache", client.out)
+        client.run("cache prune 0")
+        self.assertIn("Removed 5 files", client.out)
+        client.run("cache stats")
+        self.assertIn("Files: 0 (0 urls)", client.out)
+        self.assertIn("Size: 0 B", client.out)
+        client.run("cache prune 1T", assert_error=True)
+        self.assertIn("ERROR: Invalid size '1T'", client.out)
+
     @unittest.skipIf(get_env("TESTING_REVISIONS_ENABLED", False), "Hybrid test with both v1 and v2")
     def test_revision0_v2_skip(self):
         client = TestClient(default_server_user=True)
@@ -206,23 +241,25 @@ class DownloadCacheTest(unittest.TestCase):
 
 class CachedDownloaderUnitTest(unittest.TestCase):
     def setUp(self):
-        cache_folder = temp_folder()
+        self.cache_folder = temp_folder()
 
         class FakeFileDownloader(object):
             def __init__(self):
                 self.calls = Counter()
+                self.contents = {}
 
             def download(self, url, file_path_=None, *args, **kwargs):
                 if "slow" in url:
                     time.sleep(0.5)
                 self.calls[url] += 1
+                content = self.contents.get(url, url)
                 if file_path_:
-                    save(file_path_, url)
+                    save(file_path_, content)
                 else:
-                    return url
+                    return content
 
         self.file_downloader = FakeFileDownloader()
-        self.cached_downloader = CachedFileDownloader(cache_folder, self.file_downloader)
+        self.cached_downloader = CachedFileDownloader(self.cache_folder, self.file_downloader)
 
     def concurrent_locks_test(self):
         folder = temp_folder()
@@ -284,3 +321,62 @@ class CachedDownloaderUnitTest(unittest.TestCase):
         self.cached_downloader.download("testurl", file_path)
         self.assertEqual(self.file_downloader.calls["testurl"], 1)
         self.assertEqual("testurl", load(file_path))
+
+    def test_same_contents(self):
+        self.file_downloader.contents = {"testurl": "content", "testurl2": "content"}
+        folder = temp_folder()
+        self.cached_downloader.download("testurl", os.path.join(folder, "myfile.txt"))
+        self.cached_downloader.download("testurl2", os.path.join(folder, "myfile2.txt"))
+        self.assertEqual("content", load(os.path.join(folder, "myfile.txt")))
+        self.assertEqual("content", load(os.path.join(folder, "myfile2.txt")))
+        # Both urls are downloaded, but there is only one copy of the contents
+        self.assertEqual(self.file_downloader.calls["testurl"], 1)
+        self.assertEqual(self.file_downloader.calls["testurl2"], 1)
+        info = download_cache_info(self.cache_folder)
+        self.assertEqual(1, info["files"])
+        self.assertEqual(2, info["urls"])
+
+    def test_modify_downloaded_file(self):
+        folder = temp_folder()
+        file_path = os.path.join(folder, "myfile.txt")
+        self.cached_downloader.download("testurl", file_path)
+        save(file_path, "modified")
+        self.cached_downloader.download("testurl", os.path.join(folder, "myfile2.txt"))
+        self.assertEqual("testurl", load(os.path.join(folder, "myfile2.txt")))
+
+    def test_previous_layout(self):
+        h = self.cached_downloader._get_hash("testurl")
+        save(os.path.join(self.cache_folder, h), "testurl")
+        content = self.cached_downloader.download("testurl")
+        self.assertEqual(content.decode("utf-8"), "testurl")
+        self.assertEqual(self.file_downloader.calls["testurl"], 0)
+        self.assertFalse(os.path.exists(os.path.join(self.cache_folder, h)))
+        self.assertEqual(1, download_cache_info(self.cache_folder)["files"])
+
+    def test_stats_prune(self):
+        folder = temp_folder()
+        for i, url in enumerate(("testurl", "testurl2", "testurl3", "testurl")):
+            self.cached_downloader.download(url, os.path.join(folder, "myfile%s.txt" % i))
+        info = download_cache_info(self.cache_folder)
+        self.assertEqual(3, info["files"])
+        self.assertEqual(3, info["urls"])
+        self.assertEqual(len("testurl") + len("testurl2") * 2, info["size"])
+        self.assertEqual(1, info["hits"])
+        self.assertEqual(len("testurl"), info["hit_bytes"])
+        self.assertEqual(3, info["misses"])
+
+        # "testurl" was the most recently used, it is kept
+        blobs = os.path.join(self.cache_folder, "blobs")
+        for i, name in enumerate(sorted(os.listdir(blobs))):
+            os.utime(os.path.join(blobs, name), (1000 + i, 1000 + i))
+        h = self.cached_downloader._get_hash("testurl")
+        blob = load(os.path.join(self.cache_folder, "index", h))
+        os.utime(os.path.join(blobs, blob), None)
+        removed, removed_size = prune_download_cache(self.cache_folder, len("testurl"))
+        self.assertEqual(2, removed)
+        self.assertEqual(len("testurl2") * 2, removed_size)
+        self.assertEqual([blob], os.listdir(blobs))
+        self.assertEqual([h], os.listdir(os.path.join(self.cache_folder, "index")))
+
+        self.cached_downloader.download("testurl2", os.path.join(folder, "myfile.txt"))
+        self.assertEqual(self.file_downloader.calls["testurl2"], 2)
@@ -0,0 +1,94 @@
+import json
+import os
+import platform
+import textwrap
+import unittest
+
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient
+from conans.util.files import load, save
+
+
+@unittest.skipIf(platform.system() == "Windows", "Parallel builds need os.fork()")
+class InstallParallelBuildTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        # Do not depend on the detected compiler of the machine running the tests
+        save(self.client.cache.default_profile_path, textwrap.dedent("""
+            [settings]
+            os=Linux
+            arch=x86_64
+            build_type=Release
+            """))
+        self.times_folder = temp_folder()
+        self.conanfile = textwrap.dedent("""
+            import os, time, json
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                requires = {requires}
+                def build(self):
+                    start = time.time()
+                    self.output.info("Start build")
+                    time.sleep(1)
+                    self.output.info("End build")
+                    path = os.path.join(r"{times}", "%s.json" % self.name)
+                    with open(path, "w") as f:
+                        json.dump([start, time.time()], f)
+                    {fail}
+                def package_info(self):
+                    self.cpp_info.libs = [self.name]
+            """)
+
+    def _export(self, name, requires=(), fail=False):
+        conanfile = self.conanfile.format(requires=repr(tuple(requires)), times=self.times_folder,
+                                          fail="raise Exception('Crash!')" if fail else "")
+        self.client.save({"conanfile.py": conanfile}, clean_first=True)
+        self.client.run("export . %s/0.1@user/testing" % name)
+
+    def _times(self, name):
+        return json.loads(load(os.path.join(self.times_folder, "%s.json" % name)))
+
+    def test_parallel_build(self):
+        self._export("pkga")
+        self._export("pkgb")
+        self._export("pkgc", requires=["pkga/0.1@user/testing"])
+        self._export("pkgd", requires=["pkgb/0.1@user/testing", "pkgc/0.1@user/testing"])
+        self.client.run("config set general.parallel_build=4")
+        self.client.run("install pkgd/0.1@user/testing --build=missing -g txt")
+        self.assertIn("Building binary packages in 4 parallel jobs", self.client.out)
+
+        # pkga and pkgb are independent, built at the same time
+        pkga, pkgb = self._times("pkga"), self._times("pkgb")
+        self.assertLess(max(pkga[0], pkgb[0]), min(pkga[1], pkgb[1]))
+        # pkgc starts as soon as pkga finishes, pkgd when everything is built
+        pkgc, pkgd = self._times("pkgc"), self._times("pkgd")
+        self.assertGreaterEqual(pkgc[0], pkga[1])
+        self.assertGreaterEqual(pkgd[0], max(pkgb[1], pkgc[1]))
+
+        # The output of every build is not interleaved
+        out = str(self.client.out)
+        for name in ("pkga", "pkgb", "pkgc", "pkgd"):
+            start = out.index("%s/0.1@user/testing: Start build" % name)
+            end = out.index("%s/0.1@user/testing: End build" % name)
+            self.assertEqual(1, len(out[start:end].splitlines()))
+            self.assertIn("%s/0.1@user/testing: Package '" % name, out)
+
+        # package_info() of the built packages is propagated to the consumers
+        info = self.client.load("conanbuildinfo.txt")
+        self.assertIn("[libs]\npkgd\npkgb\npkgc\npkga", info)
+        self.client.run("install pkgd/0.1@user/testing")
+        self.assertIn("pkgd/0.1@user/testing: Already installed!", self.client.out)
+
+    def test_build_error(self):
+        self._export("pkga")
+        self._export("pkgb", fail=True)
+        self._export("pkgc", requires=["pkga/0.1@user/testing", "pkgb/0.1@user/testing"])
+        self.client.run("config set general.parallel_build=4")
+        self.client.run("install pkgc/0.1@user/testing --build=missing", assert_error=True)
+        self.assertIn("pkgb/0.1@user/testing: Error in build() method, line 15", self.client.out)
+        self.assertIn("Crash!", self.client.out)
+        # The other running build finishes, the dependant one never starts
+        self.assertIn("pkga/0.1@user/testing: Package '", self.client.out)
+        self.assertNotIn("pkgc/0.1@user/testing: Start build", self.client.out)
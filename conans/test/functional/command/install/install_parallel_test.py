@@ -1,6 +1,15 @@
+import os
+import textwrap
+import time
 import unittest
 
+from mock import patch
+
+from conans.client.installer import BinaryInstaller
+from conans.client.remote_manager import RemoteManager
+from conans.model.ref import ConanFileReference, PackageReference
 from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import load, save
 
 
 class InstallParallelTest(unittest.TestCase):
@@ -28,3 +37,76 @@ class InstallParallelTest(unittest.TestCase):
         self.assertIn("Downloading binary packages in %s parallel threads" % threads, client.out)
         for i in range(counter):
             self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+
+
+    def test_package_info_while_downloading(self):
+        client = TestClient(default_server_user=True)
+        save(client.cache.default_profile_path, textwrap.dedent("""
+            [settings]
+            os=Linux
+            arch=x86_64
+            build_type=Release
+            """))
+        client.run("config set general.parallel_download=2")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . fast/0.1@user/testing")
+        client.run("create . slow/0.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require_plain("slow/0.1@user/testing")})
+        client.run("create . zdep/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+
+        events = []
+        original_get_package = RemoteManager.get_package
+        original_package_info = BinaryInstaller._call_package_info
+
+        def get_package(manager, pref, *args, **kwargs):
+            if pref.ref.name == "slow":
+                time.sleep(1)
+            original_get_package(manager, pref, *args, **kwargs)
+            events.append(("downloaded", pref.ref.name))
+
+        def call_package_info(installer, conanfile, *args, **kwargs):
+            events.append(("package_info", conanfile.name))
+            original_package_info(installer, conanfile, *args, **kwargs)
+
+        client.save({"conanfile.txt": "[requires]\nfast/0.1@user/testing\n"
+                                      "zdep/0.1@user/testing"}, clean_first=True)
+        with patch.object(RemoteManager, "get_package", get_package), \
+                patch.object(BinaryInstaller, "_call_package_info", call_package_info):
+            client.run("install .")
+
+        # "fast" does not wait for the download of "slow", but its dependant "zdep" does
+        self.assertLess(events.index(("package_info", "fast")),
+                        events.index(("downloaded", "slow")))
+        self.assertLess(events.index(("downloaded", "slow")),
+                        events.index(("package_info", "slow")))
+        self.assertLess(events.index(("package_info", "slow")),
+                        events.index(("package_info", "zdep")))
+        # The output of every download is kept together, next to its installation
+        install_out = str(client.out).split("Downloading binary packages in 2 parallel threads")[1]
+        lines = [line.split(":")[0] for line in install_out.splitlines()
+                 if line.startswith(("fast/", "slow/", "zdep/"))]
+        self.assertEqual(lines, sorted(lines, key=lines.index))
+        for name in ("fast", "slow", "zdep"):
+            self.assertIn("%s/0.1@user/testing: Package installed" % name, client.out)
+
+    def test_parallel_extraction(self):
+        client = TestClient(default_server_user=True)
+        conanfile = GenConanfile()
+        for i in range(50):
+            conanfile.with_package_file("include/header%s.h" % i, "header %s" % i)
+        client.save({"conanfile.py": conanfile})
+        client.run("create . pkg/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+
+        client.run("config set general.parallel_extraction=4")
+        client.run("install pkg/0.1@user/testing")
+        self.assertIn("pkg/0.1@user/testing: Package installed", client.out)
+        ref = ConanFileReference.loads("pkg/0.1@user/testing")
+        layout = client.cache.package_layout(ref)
+        pref = PackageReference(ref, os.listdir(layout.packages())[0])
+        for i in range(50):
+            self.assertEqual("header %s" % i, load(os.path.join(layout.package(pref), "include",
+                                                                "header%s.h" % i)))
@@ -0,0 +1,89 @@
+import textwrap
+import threading
+import unittest
+from collections import OrderedDict
+
+from mock import patch
+
+from conans.client.remote_manager import RemoteManager
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+from conans.util.files import save
+
+
+class ParallelBinaryAnalysisTest(unittest.TestCase):
+
+    def _client(self, parallel=None):
+        client = TestClient(servers=self.servers, users={"remote1": [("user", "password")],
+                                                         "remote2": [("user", "password")]})
+        # Do not depend on the detected compiler of the machine running the tests
+        save(client.cache.default_profile_path, textwrap.dedent("""
+            [settings]
+            os=Linux
+            arch=x86_64
+            build_type=Release
+            """))
+        client.run("config set general.revisions_enabled=1")
+        if parallel:
+            client.run("config set general.parallel_binary_analysis=%s" % parallel)
+        return client
+
+    def _install(self, parallel):
+        client = self._client(parallel)
+        client.save({"conanfile.txt": textwrap.dedent("""
+            [requires]
+            pkga/0.1@user/testing
+            pkgb/0.1@user/testing
+            pkgc/0.1@user/testing
+            """)})
+        # Get the recipes from remote2, packages will be missing there
+        client.run("download pkga/0.1@user/testing -r=remote2 --recipe")
+        client.run("download pkgb/0.1@user/testing -r=remote2 --recipe")
+        client.run("download pkgc/0.1@user/testing -r=remote2 --recipe")
+
+        worker_calls = []
+        main_thread = threading.current_thread()
+        original_get_package_info = RemoteManager.get_package_info
+
+        def get_package_info(remote_manager, pref, remote):
+            if threading.current_thread() is not main_thread:
+                worker_calls.append((str(pref.ref), remote.name))
+            return original_get_package_info(remote_manager, pref, remote)
+
+        with patch.object(RemoteManager, "get_package_info", get_package_info):
+            client.run("install .")
+        return str(client.out).replace(client.cache_folder, ""), worker_calls
+
+    def test_same_result_as_sequential(self):
+        self.servers = OrderedDict([("remote1", TestServer(users={"user": "password"})),
+                                    ("remote2", TestServer(users={"user": "password"}))])
+        client = self._client()
+        client.save({"conanfile.py": GenConanfile()})
+        for name in ("pkga", "pkgb", "pkgc"):
+            client.run("create . %s/0.1@user/testing" % name)
+            client.run("upload %s/0.1@user/testing --all -r=remote1" % name)
+            client.run("upload %s/0.1@user/testing -r=remote2" % name)
+
+        sequential_out, sequential_calls = self._install(parallel=None)
+        parallel_out, parallel_calls = self._install(parallel=4)
+        self.assertEqual([], sequential_calls)
+        # The package is not in remote2 (the recipe remote) so all the remotes are checked
+        self.assertEqual([("pkga/0.1@user/testing", "remote1"),
+                          ("pkga/0.1@user/testing", "remote2"),
+                          ("pkgb/0.1@user/testing", "remote1"),
+                          ("pkgb/0.1@user/testing", "remote2"),
+                          ("pkgc/0.1@user/testing", "remote1"),
+                          ("pkgc/0.1@user/testing", "remote2")], sorted(parallel_calls))
+        self.assertEqual(sequential_out, parallel_out)
+        self.assertIn("pkgc/0.1@user/testing:5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9 - Download",
+                      parallel_out)
+        self.assertIn("pkgc/0.1@user/testing: Retrieving package "
+                      "5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9 from remote 'remote1'",
+                      parallel_out)
+
+    def test_invalid_value(self):
+        self.servers = None
+        client = self._client()
+        client.save({"conanfile.txt": ""})
+        client.run("config set general.parallel_binary_analysis=0")
+        client.run("install .", assert_error=True)
+        self.assertIn("'parallel_binary_analysis' must be a number greater than 0", client.out)
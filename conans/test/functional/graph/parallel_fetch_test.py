@@ -0,0 +1,94 @@
+import textwrap
+import threading
+import unittest
+
+from mock import patch
+
+from conans.client.graph.proxy import ConanProxy
+from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import save
+
+
+class ParallelFetchTest(unittest.TestCase):
+    maxDiff = None
+
+    @staticmethod
+    def _client(**kwargs):
+        client = TestClient(**kwargs)
+        # Do not depend on the detected compiler of the machine running the tests
+        save(client.cache.default_profile_path, textwrap.dedent("""
+            [settings]
+            os=Linux
+            arch=x86_64
+            build_type=Release
+            """))
+        return client
+
+    def _install(self, parallel):
+        client = self._client(servers=self.servers, users={"default": [("user", "password")]})
+        if parallel:
+            client.run("config set general.parallel_graph_fetch=4")
+        client.save({"conanfile.txt": textwrap.dedent("""
+            [requires]
+            pkga/[>0.1]@user/testing
+            pkgb/0.1@user/testing
+            pkgc/0.1@user/testing
+            """)})
+
+        worker_calls = []
+        main_thread = threading.current_thread()
+        original_get_recipe = ConanProxy.get_recipe
+
+        def get_recipe(proxy, *args, **kwargs):
+            if threading.current_thread() is not main_thread:
+                worker_calls.append(args[0])
+            return original_get_recipe(proxy, *args, **kwargs)
+
+        with patch.object(ConanProxy, "get_recipe", get_recipe):
+            client.run("install . --build=missing")
+        install_out = str(client.out).replace(client.cache_folder, "")
+        client.run("info .")
+        return install_out, str(client.out), worker_calls
+
+    def test_same_result_as_sequential(self):
+        client = self._client(default_server_user=True)
+        self.servers = client.servers
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . pkga/0.1@user/testing")
+        client.run("create . pkga/0.2@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require_plain("pkga/0.1@user/testing")})
+        client.run("create . pkgb/0.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require_plain("pkgb/0.1@user/testing")})
+        client.run("create . pkgc/0.1@user/testing")
+        client.run("upload * --all --confirm")
+
+        sequential_install, sequential_info, sequential_calls = self._install(parallel=False)
+        parallel_install, parallel_info, parallel_calls = self._install(parallel=True)
+        self.assertEqual([], sequential_calls)
+        self.assertEqual(["pkga/0.2@user/testing", "pkgb/0.1@user/testing",
+                          "pkgc/0.1@user/testing"], sorted(str(r) for r in parallel_calls))
+        # "Required by" iterates a set of dependants, its order is not stable across runs
+        self.assertEqual(sorted(sequential_info.splitlines()),
+                         sorted(parallel_info.splitlines()))
+        self.assertEqual(sequential_install, parallel_install)
+        self.assertIn("pkga/0.2@user/testing: Downloaded recipe revision 0", parallel_install)
+        self.assertIn("pkgc/0.1@user/testing: Downloaded recipe revision 0", parallel_install)
+
+    def test_error_deferred(self):
+        client = self._client(default_server_user=True)
+        client.run("config set general.parallel_graph_fetch=4")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . pkga/0.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require_plain("pkga/0.1@user/testing")
+                                                   .with_require_plain("missing/0.1@user/testing")})
+        client.run("install .", assert_error=True)
+        self.assertIn("ERROR: Failed requirement 'missing/0.1@user/testing' from "
+                      "'conanfile.py'", client.out)
+        self.assertIn("Unable to find 'missing/0.1@user/testing' in remotes", client.out)
+
+    def test_invalid_value(self):
+        client = self._client()
+        client.save({"conanfile.txt": ""})
+        client.run("config set general.parallel_graph_fetch=-1")
+        client.run("install .", assert_error=True)
+        self.assertIn("'parallel_graph_fetch' must be a number greater than 0", client.out)
@@ -2,11 +2,13 @@ import textwrap
 import unittest
 from collections import OrderedDict
 
+from mock import patch
 from parameterized import parameterized
 
+from conans.client.remote_manager import RemoteManager
 from conans.paths import CONANFILE
-from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer, \
-    inc_package_manifest_timestamp, inc_recipe_manifest_timestamp
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient, \
+    TestServer, inc_package_manifest_timestamp, inc_recipe_manifest_timestamp
 
 
 class VersionRangesUpdatingTest(unittest.TestCase):
@@ -48,6 +50,55 @@ class VersionRangesUpdatingTest(unittest.TestCase):
         self.assertNotIn("boost/1.69.0", client.out)
         self.assertNotIn("boost/1.68.0", client.out)
 
+    def test_remote_versions_ttl(self):
+        servers = {"default": TestServer()}
+        client = TestClient(servers=servers, users={"default": [("lasote", "mypass")]})
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . boost/1.68.0@lasote/stable")
+        client.run("upload * -r=default --all --confirm")
+        client.run("config set general.version_ranges_ttl=1h")
+        client.save({"conanfile.txt": "[requires]\nboost/[>=1.68.0]@lasote/stable"},
+                    clean_first=True)
+
+        searches = []
+        original_search = RemoteManager.search_recipes
+
+        def search_recipes(manager, remote, pattern=None, ignorecase=True):
+            searches.append(pattern)
+            return original_search(manager, remote, pattern, ignorecase)
+
+        with patch.object(RemoteManager, "search_recipes", search_recipes):
+            client.run("install . --update")
+            self.assertEqual(["boost"], searches)
+            client.run("install . --update")
+            self.assertEqual(["boost"], searches)
+            self.assertIn("resolved to 'boost/1.68.0@lasote/stable' in remote 'default'",
+                          client.out)
+
+            # Versions uploaded by other clients are not seen until the listing expires
+            other = TestClient(servers=servers, users={"default": [("lasote", "mypass")]})
+            other.save({"conanfile.py": GenConanfile()})
+            other.run("create . boost/1.69.0@lasote/stable")
+            other.run("upload * -r=default --all --confirm")
+            client.run("install . --update")
+            self.assertEqual(["boost"], searches)
+            self.assertIn("resolved to 'boost/1.68.0@lasote/stable' in remote 'default'",
+                          client.out)
+
+            # Exporting, uploading or removing the recipe lists the remote versions again
+            client.run("remove boost/1.68.0@lasote/stable -f")
+            client.run("install . --update")
+            self.assertEqual(["boost", "boost"], searches)
+            self.assertIn("resolved to 'boost/1.69.0@lasote/stable' in remote 'default'",
+                          client.out)
+
+    def test_remote_versions_ttl_invalid(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.txt": "[requires]\nboost/[>=1.68.0]@lasote/stable"})
+        client.run("config set general.version_ranges_ttl=forever")
+        client.run("install . --update", assert_error=True)
+        self.assertIn("Incorrect definition of general.version_ranges_ttl: forever", client.out)
+
     def update_test(self):
         client = TestClient(servers={"default": TestServer()},
                             users={"default": [("lasote", "mypass")]})
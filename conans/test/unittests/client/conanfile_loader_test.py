@@ -5,10 +5,11 @@ import unittest
 from collections import OrderedDict
 
 import six
-from mock import Mock
+from mock import Mock, patch
 from mock.mock import call
 from parameterized import parameterized
 
+from conans.client import loader
 from conans.client.graph.python_requires import ConanPythonRequire
 from conans.client.loader import ConanFileLoader, ConanFileTextLoader,\
     _parse_conanfile
@@ -353,3 +354,37 @@ def append(data):
             self.assertIs(loaded1.myconanlogger.value, loaded2.myconanlogger.value)
         finally:
             sys.path.remove(temp)
+
+    def test_bytecode_cache(self):
+        tmp = temp_folder()
+        conanfile_path = os.path.join(tmp, "conanfile.py")
+        bytecode_folder = os.path.join(temp_folder(), "bytecode")
+        save(conanfile_path, "def conanfile_func():\n    return 1\n")
+
+        def load():
+            with patch.object(loader, "compile", create=True, side_effect=compile) as compile_mock:
+                loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+            return loaded.conanfile_func(), compile_mock.call_count
+
+        self.assertEqual((1, 1), load())
+        self.assertEqual(1, len(os.listdir(bytecode_folder)))
+        self.assertEqual((1, 0), load())
+
+        save(conanfile_path, "def conanfile_func():\n    return 2\n")
+        self.assertEqual((2, 1), load())
+        self.assertEqual((2, 0), load())
+        self.assertEqual(1, len(os.listdir(bytecode_folder)))
+
+        bytecode_path = os.path.join(bytecode_folder, os.listdir(bytecode_folder)[0])
+        with open(bytecode_path, "rb") as f:
+            bytecode = f.read()
+        with open(bytecode_path, "wb") as f:
+            f.write(bytecode[:70])
+        self.assertEqual((2, 1), load())
+        self.assertEqual((2, 0), load())
+
+        # The tracebacks point to the original file
+        save(conanfile_path, "def conanfile_func():\n    raise Exception('boom')\n")
+        for _ in range(2):
+            loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+            self.assertEqual(conanfile_path, loaded.conanfile_func.__code__.co_filename)
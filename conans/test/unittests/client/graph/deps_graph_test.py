@@ -1,5 +1,9 @@
+import random
+import time
 import unittest
 
+from nose.plugins.attrib import attr
+
 from conans.client.graph.graph import CONTEXT_HOST
 from conans.client.graph.graph_builder import DepsGraph, Node
 from conans.model.conan_file import ConanFile
@@ -110,3 +114,81 @@ class DepsGraphTest(unittest.TestCase):
         deps.add_edge(n2, n32, None)
         deps.add_edge(n32, n5, None)
         self.assertEqual([[n5, n31], [n32], [n2], [n1]], deps.by_levels())
+
+    def test_levels_cache(self):
+        ref1 = ConanFileReference.loads("Hello/1.0@user/stable")
+        ref2 = ConanFileReference.loads("Hello/2.0@user/stable")
+        ref3 = ConanFileReference.loads("Hello/3.0@user/stable")
+
+        deps = DepsGraph()
+        n1 = Node(ref1, 1, context=CONTEXT_HOST)
+        n2 = Node(ref2, 2, context=CONTEXT_HOST)
+        n3 = Node(ref3, 3, context=CONTEXT_HOST)
+        deps.add_node(n1)
+        deps.add_node(n2)
+        deps.add_edge(n1, n2, None)
+        levels = deps.by_levels()
+        self.assertEqual([[n2], [n1]], levels)
+        levels[0].append(n3)  # Modifying the result doesn't affect the graph
+        self.assertEqual([[n2], [n1]], deps.by_levels())
+        self.assertEqual([[n1], [n2]], deps.inverse_levels())
+        self.assertEqual([[n1]], deps.by_levels(nodes_subset={n1}))
+
+        deps.add_node(n3)
+        self.assertEqual([[n2, n3], [n1]], deps.by_levels())
+        deps.add_edge(n2, n3, None)
+        self.assertEqual([[n3], [n2], [n1]], deps.by_levels())
+        self.assertEqual([[n2], [n1]], deps.by_levels(nodes_subset={n1, n2}))
+
+
+def _synthetic_graph(size, seed=1):
+    rand = random.Random(seed)
+    deps = DepsGraph()
+    nodes = []
+    for i in range(size):
+        ref = ConanFileReference.loads("pkg%s/1.0@user/stable" % i)
+        node = Node(ref, i, context=CONTEXT_HOST)
+        deps.add_node(node)
+        # Only depend on previous nodes, so there are no loops
+        for dep in rand.sample(nodes, min(len(nodes), rand.randint(0, 4))):
+            deps.add_edge(node, dep, None)
+        nodes.append(node)
+    return deps
+
+
+def _scan_levels(deps, direct):
+    # The previous implementation, re-scanning all the remaining nodes at every level
+    result = []
+    opened = deps.nodes
+    while opened:
+        current_level = []
+        for o in opened:
+            o_neighs = o.neighbors() if direct else o.inverse_neighbors()
+            if not any(n in opened for n in o_neighs):
+                current_level.append(o)
+        current_level.sort()
+        result.append(current_level)
+        opened = opened.difference(current_level)
+    return result
+
+
+@attr("slow")
+class DepsGraphLevelsBenchmark(unittest.TestCase):
+
+    def test_levels_benchmark(self):
+        for size in (2000, 5000, 10000):
+            deps = _synthetic_graph(size)
+            start = time.time()
+            expected = _scan_levels(deps, True), _scan_levels(deps, False)
+            scan_time = time.time() - start
+            start = time.time()
+            levels = deps.by_levels(), deps.inverse_levels()
+            kahn_time = time.time() - start
+            start = time.time()
+            for _ in range(10):
+                deps.by_levels()
+                deps.inverse_levels()
+            cached_time = (time.time() - start) / 10
+            self.assertEqual(expected, levels)
+            print("%s nodes, %s levels: scan %.3fs, kahn %.3fs, cached %.3fs"
+                  % (size, len(levels[0]), scan_time, kahn_time, cached_time))
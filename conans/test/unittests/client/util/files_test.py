@@ -1,11 +1,12 @@
 import os
+import tarfile
 import time
 import unittest
 
 from conans.client.cmd.uploader import compress_files
 from conans.paths import PACKAGE_TGZ_NAME
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import md5sum, mkdir, path_exists, save
+from conans.util.files import gzopen_without_timestamps, load, md5sum, mkdir, path_exists, save
 
 
 class FilesTest(unittest.TestCase):
@@ -39,6 +40,45 @@ class FilesTest(unittest.TestCase):
 
         self.assertEqual(md5_a, md5_b)
 
+    def test_parallel_compress(self):
+        folder = temp_folder()
+        # Several compression blocks, partly compressible
+        big_contents = b"".join(os.urandom(64) + b"x" * 64 for _ in range(30000))
+        save(os.path.join(folder, "big.bin"), big_contents)
+        save(os.path.join(folder, "small.txt"), b"The contents")
+        save(os.path.join(folder, "empty.txt"), b"")
+        files = {name: os.path.join(folder, name) for name in ("big.bin", "small.txt",
+                                                               "empty.txt")}
+
+        checksums = set()
+        for parallel in (2, 4, 4):
+            dest = temp_folder()
+            compress_files(files, {"link.txt": "small.txt"}, PACKAGE_TGZ_NAME, dest_dir=dest,
+                           compresslevel=6, parallel=parallel)
+            file_path = os.path.join(dest, PACKAGE_TGZ_NAME)
+            checksums.add(md5sum(file_path))
+
+            # Standard gzip, that can be read with tarfile
+            extract_folder = temp_folder()
+            with tarfile.open(file_path, "r:gz") as tgz:
+                tgz.extractall(extract_folder)
+            self.assertEqual(big_contents,
+                             load(os.path.join(extract_folder, "big.bin"), binary=True))
+            self.assertEqual("The contents", load(os.path.join(extract_folder, "small.txt")))
+            self.assertEqual("", load(os.path.join(extract_folder, "empty.txt")))
+            self.assertEqual("small.txt", os.readlink(os.path.join(extract_folder, "link.txt")))
+        # The output doesn't depend on the number of threads
+        self.assertEqual(1, len(checksums))
+
+    def test_parallel_compress_empty(self):
+        dest = temp_folder()
+        file_path = os.path.join(dest, PACKAGE_TGZ_NAME)
+        compress_files({}, {}, PACKAGE_TGZ_NAME, dest_dir=dest, parallel=2)
+        with open(file_path, "rb") as f:
+            tgz = gzopen_without_timestamps(PACKAGE_TGZ_NAME, fileobj=f)
+            self.assertEqual([], tgz.getnames())
+            tgz.close()
+
     def test_path_exists(self):
         """
         Unit test of path_exists
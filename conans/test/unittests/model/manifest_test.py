@@ -1,9 +1,12 @@
 import os
+import time
 import unittest
 
+from mock import patch
+
 from conans.model.manifest import FileTreeManifest
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import load, md5, save
+from conans.util.files import load, md5, md5sum, save
 
 
 class ManifestTest(unittest.TestCase):
@@ -34,6 +37,43 @@ class ManifestTest(unittest.TestCase):
             content = files[filepath]
             self.assertEqual(md5(content), md5readed)
 
+    def test_hash_cache(self):
+        tmp_dir = temp_folder()
+        files = {"one.ext": "one", "path/to/two.txt": "two", "three.txt": "three"}
+        old = time.time() - 100
+        for filename, content in files.items():
+            save(os.path.join(tmp_dir, filename), content)
+            os.utime(os.path.join(tmp_dir, filename), (old, old))
+        hash_cache = os.path.join(temp_folder(), "hashes")
+        expected = FileTreeManifest.create(tmp_dir)
+
+        def create():
+            with patch("conans.model.manifest.md5sum", side_effect=md5sum) as md5sum_mock:
+                manifest = FileTreeManifest.create(tmp_dir, hash_cache=hash_cache)
+            self.assertEqual(expected, manifest)
+            return sorted(os.path.basename(c[0][0]) for c in md5sum_mock.call_args_list)
+
+        self.assertEqual(["one.ext", "three.txt", "two.txt"], create())
+        self.assertEqual([], create())
+
+        # Same size, but modified
+        save(os.path.join(tmp_dir, "one.ext"), "uno")
+        expected = FileTreeManifest.create(tmp_dir)
+        self.assertEqual(["one.ext"], create())
+        # Recently modified files are always read, they could be modified again keeping the stat
+        self.assertEqual(["one.ext"], create())
+        os.utime(os.path.join(tmp_dir, "one.ext"), (old, old))
+        self.assertEqual(["one.ext"], create())
+        self.assertEqual([], create())
+
+        os.remove(os.path.join(tmp_dir, "three.txt"))
+        save(os.path.join(tmp_dir, "four.txt"), "four")
+        expected = FileTreeManifest.create(tmp_dir)
+        self.assertEqual(["four.txt"], create())
+
+        save(hash_cache, "corrupted")
+        self.assertEqual(["four.txt", "one.ext", "two.txt"], create())
+
     def already_pyc_in_manifest_test(self):
         tmp_dir = temp_folder()
         save(os.path.join(tmp_dir, "man.txt"), "1478122267\nconanfile.pyc: "
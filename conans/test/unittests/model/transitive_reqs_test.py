@@ -87,6 +87,7 @@ class GraphTest(unittest.TestCase):
                                         self.resolver, None)
         cache = Mock()
         cache.config.default_package_id_mode = "semver_direct_mode"
+        cache.config.parallel_binary_analysis = None
         self.binaries_analyzer = GraphBinariesAnalyzer(cache, self.output, self.remote_manager)
 
     def build_graph(self, content, options="", settings=""):
@@ -1,6 +1,9 @@
 import os
+import time
 import unittest
 
+from mock import patch
+
 from conans.client.cache.cache import ClientCache
 from conans.client.tools import chdir
 from conans.model.info import ConanInfo
@@ -9,7 +12,7 @@ from conans.paths import (BUILD_FOLDER, CONANINFO, EXPORT_FOLDER, PACKAGES_FOLDE
 from conans.search.search import search_packages, search_recipes
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestBufferConanOutput
-from conans.util.files import save, mkdir
+from conans.util.files import mkdir, rmdir, save
 
 
 class SearchTest(unittest.TestCase):
@@ -37,6 +40,40 @@ class SearchTest(unittest.TestCase):
             all_artif = [_artif for _artif in sorted(packages)]
             self.assertEqual(all_artif, artifacts)
 
+    def test_packages_index(self):
+        ref = ConanFileReference.loads("opencv/2.4.10@lasote/testing")
+        layout = self.cache.package_layout(ref)
+        os.makedirs(layout.export())
+        old = time.time() - 100
+        for package_id, os_ in (("a", "Linux"), ("b", "Windows"), ("c", "Linux")):
+            info_path = os.path.join(layout.packages(), package_id, CONANINFO)
+            save(info_path, "[settings]\n  os=%s\n[options]\n  shared=True" % os_)
+            os.utime(info_path, (old, old))
+
+        def search(query):
+            with patch.object(ConanInfo, "loads", side_effect=ConanInfo.loads) as loads:
+                packages = search_packages(layout, query)
+            return sorted(packages), loads.call_count
+
+        self.assertEqual((["a", "c"], 3), search("os=Linux AND shared=True"))
+        self.assertTrue(os.path.exists(layout.packages_index()))
+        self.assertEqual((["b"], 0), search("os=Windows"))
+        self.assertEqual((["a", "b", "c"], 0), search(None))
+
+        info_path = os.path.join(layout.packages(), "c", CONANINFO)
+        save(info_path, "[settings]\n  os=Windows\n[options]\n  shared=True")
+        self.assertEqual((["b", "c"], 1), search("os=Windows"))
+        # Recently modified, not indexed until it is older than the filesystem timestamps resolution
+        self.assertEqual((["b", "c"], 1), search("os=Windows"))
+        os.utime(info_path, (old, old))
+        self.assertEqual((["b", "c"], 1), search("os=Windows"))
+        self.assertEqual((["b", "c"], 0), search("os=Windows"))
+
+        rmdir(os.path.join(layout.packages(), "b"))
+        self.assertEqual((["c"], 0), search("os=Windows"))
+        save(layout.packages_index(), "corrupted")
+        self.assertEqual((["a"], 2), search("os=Linux"))
+
     def pattern_test(self):
         with chdir(self.cache.store):
             references = ["opencv/2.4.%s@lasote/testing" % ref for ref in ("1", "2", "3")]
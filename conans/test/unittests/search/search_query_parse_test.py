@@ -2,7 +2,7 @@ import unittest
 
 import six
 
-from conans.search.query_parse import evaluate_postfix, infix_to_postfix
+from conans.search.query_parse import compile_postfix, evaluate_postfix, infix_to_postfix
 
 
 class QueryParseTest(unittest.TestCase):
@@ -46,3 +46,14 @@ class QueryParseTest(unittest.TestCase):
         self.assertTrue(evaluate("a=2 AND j=45 OR (h=23 AND a=2)"))
         self.assertTrue(evaluate("((((a=2 AND ((((f=23 OR j=45))))))))"))
         self.assertFalse(evaluate("((((a=2 AND ((((f=23 OR j=42))))))))"))
+
+    def test_compile_postfix(self):
+        queries = ["", "a=2", "a=4", "a=2 OR a=3", "a=4 OR j=45", "a=4 AND j=45",
+                   "a=2 AND (f=23 OR j=45)", "a=2 AND (f=23 OR j=435)", "a=2 AND j=45 OR h=23",
+                   "a=2 AND j=45 OR (h=23 AND a=2)", "((((a=2 AND ((((f=23 OR j=45))))))))",
+                   "((((a=2 AND ((((f=23 OR j=42))))))))"]
+        for item in (("a=2", "j=45"), ("a=4", "j=45"), ("f=23", ), ()):
+            for q in queries:
+                r = infix_to_postfix(q)
+                evaluate = compile_postfix(r, lambda expr: lambda it: expr in it)
+                self.assertEqual(evaluate_postfix(r, lambda expr: expr in item), evaluate(item))
@@ -2,13 +2,14 @@
 
 import os
 import platform
+import stat
 import tarfile
 import unittest
 
 from conans.client.tools.files import chdir
 from conans.model.manifest import gather_files
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import tar_extract, gzopen_without_timestamps, save
+from conans.util.files import tar_extract, gzopen_without_timestamps, load, save
 
 
 class TarExtractTest(unittest.TestCase):
@@ -61,3 +62,52 @@ class TarExtractTest(unittest.TestCase):
             with open(self.tgz_file, 'rb') as file_handler:
                 tar_extract(file_handler, destination_dir)
             check_files(destination_dir)
+
+    def test_parallel_extract(self):
+        ori_files_dir = os.path.join(self.tmp_folder, "ori_parallel")
+        files = {"file%s.txt" % i: "contents %s" % i for i in range(200)}
+        files.update({"folder/sub%s/file.txt" % i: "sub %s" % i for i in range(20)})
+        for name, contents in files.items():
+            save(os.path.join(ori_files_dir, name), contents)
+        executable = os.path.join(ori_files_dir, "folder", "run.sh")
+        save(executable, "echo hello")
+        os.chmod(executable, os.stat(executable).st_mode | stat.S_IXUSR)
+        big_contents = os.urandom(1024 * 1024) * 20  # Streamed, not in memory
+        save(os.path.join(ori_files_dir, "big.bin"), big_contents)
+
+        tgz_file = os.path.join(self.tmp_folder, "parallel.tgz")
+        with open(tgz_file, "wb") as tgz_handle:
+            tgz = gzopen_without_timestamps("name", mode="w", fileobj=tgz_handle)
+            tgz.add(ori_files_dir, arcname=".")
+            evil = tarfile.TarInfo(name="../evil.txt")
+            tgz.addfile(evil)
+            link = tarfile.TarInfo(name="link.txt")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "file1.txt"
+            tgz.addfile(link)
+            tgz.close()
+
+        destination_dir = os.path.join(self.tmp_folder, "dest_parallel")
+        with open(tgz_file, "rb") as file_handler:
+            tar_extract(file_handler, destination_dir, parallel=4)
+
+        for name, contents in files.items():
+            self.assertEqual(contents, load(os.path.join(destination_dir, name)))
+        self.assertEqual(big_contents, load(os.path.join(destination_dir, "big.bin"),
+                                            binary=True))
+        self.assertTrue(os.stat(os.path.join(destination_dir, "folder", "run.sh")).st_mode
+                        & stat.S_IXUSR)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_folder, "evil.txt")))
+        if platform.system() != "Windows":
+            self.assertEqual("file1.txt", os.readlink(os.path.join(destination_dir, "link.txt")))
+
+    def test_parallel_extract_corrupted(self):
+        with open(self.tgz_file, "rb") as f:
+            contents = f.read()
+        corrupted = os.path.join(self.tmp_folder, "corrupted.tgz")
+        with open(corrupted, "wb") as f:
+            f.write(contents[:len(contents) // 2])
+        destination_dir = os.path.join(self.tmp_folder, "dest_corrupted")
+        with open(corrupted, "rb") as file_handler:
+            with self.assertRaises((EOFError, tarfile.TarError, IOError)):
+                tar_extract(file_handler, destination_dir, parallel=4)
@@ -1,13 +1,20 @@
 import errno
+import gzip
 import hashlib
 import os
 import platform
 import re
 import shutil
 import stat
+import struct
 import sys
 import tarfile
 import tempfile
+import threading
+import time
+import zlib
+from collections import deque
+from multiprocessing.pool import ThreadPool
 
 
 from os.path import abspath, join as joinpath, realpath
@@ -136,6 +143,25 @@ def md5(content):
     return md5alg.hexdigest()
 
 
+def stat_key(path):
+    """ [size, mtime_ns, ctime_ns, inode] identifying the contents of a file, to reuse the
+    results computed from them while it does not change. The ctime cannot be restored like the
+    mtime (tar extraction, copy2), so a file created again reusing the inode of a removed one
+    with the same size and mtime is not confused with it
+    """
+    st = os.stat(path)
+    if hasattr(st, "st_mtime_ns"):
+        return [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+    return [st.st_size, int(st.st_mtime * 1e9), int(st.st_ctime * 1e9), st.st_ino]  # py2
+
+
+def racy_stat_time():
+    """ Files modified after this time (ns) might be modified again within the timestamp
+    resolution of the filesystem keeping the same stat_key(), they cannot be trusted yet
+    """
+    return (time.time() - 2) * 1000000000
+
+
 def md5sum(file_path):
     return _generic_algorithm_sum(file_path, "md5")
 
@@ -295,14 +321,77 @@ def path_exists(path, basedir):
     return True
 
 
-def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None, **kwargs):
+def _compress_block(data, compresslevel, last):
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last
+                                                        else zlib.Z_SYNC_FLUSH)
+
+
+class _ParallelGzipFile(object):
+    """ Write only file object producing a standard, single member, gzip stream. The input is
+    split in blocks that are compressed independently by a pool of threads and flushed at byte
+    boundaries, so the output depends only on the input and the compression level, never on
+    the number of threads. The header has no timestamp, like gzopen_without_timestamps
+    """
+    block_size = 1024 * 1024
+
+    def __init__(self, fileobj, compresslevel, parallel):
+        self._fileobj = fileobj
+        self._compresslevel = compresslevel
+        self._pool = ThreadPool(parallel)
+        self._max_pending = 2 * parallel  # Bounded memory, not the whole file
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._crc = zlib.crc32(b"") & 0xffffffff
+        self._size = 0
+        self._closed = False
+        xfl = b"\x02" if compresslevel == 9 else (b"\x04" if compresslevel == 1 else b"\x00")
+        fileobj.write(b"\x1f\x8b\x08\x00\x00\x00\x00\x00" + xfl + b"\xff")
+
+    def tell(self):
+        return self._size
+
+    def write(self, data):
+        self._crc = zlib.crc32(data, self._crc) & 0xffffffff
+        self._size += len(data)
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+            self._submit(block, last=False)
+        return len(data)
+
+    def _submit(self, block, last):
+        result = self._pool.apply_async(_compress_block, (block, self._compresslevel, last))
+        self._pending.append(result)
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().get())
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().get())
+            self._fileobj.write(struct.pack("<II", self._crc, self._size & 0xffffffff))
+        finally:
+            self._pool.terminate()
+            self._pool.join()
+
+
+def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None, parallel=None,
+                              **kwargs):
     """ !! Method overrided by laso to pass mtime=0 (!=None) to avoid time.time() was
         setted in Gzip file causing md5 to change. Not possible using the
         previous tarfile open because arguments are not passed to GzipFile constructor
+        :param parallel: number of threads to compress blocks of the tar (mode "w" only)
     """
     from tarfile import CompressionError, ReadError
 
-    compresslevel = compresslevel or int(os.getenv("CONAN_COMPRESSION_LEVEL", 9))
+    if compresslevel is None:
+        compresslevel = int(os.getenv("CONAN_COMPRESSION_LEVEL", 9))
 
     if mode not in ("r", "w"):
         raise ValueError("mode must be 'r' or 'w'")
@@ -314,7 +403,10 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
         raise CompressionError("gzip module is not available")
 
     try:
-        fileobj = gzip.GzipFile(name, mode, compresslevel, fileobj, mtime=0)
+        if mode == "w" and parallel and parallel > 1 and fileobj is not None:
+            fileobj = _ParallelGzipFile(fileobj, compresslevel, parallel)
+        else:
+            fileobj = gzip.GzipFile(name, mode, compresslevel, fileobj, mtime=0)
     except OSError:
         if fileobj is not None and mode == 'r':
             raise ReadError("not a gzip file")
@@ -336,9 +428,12 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
     return t
 
 
-def tar_extract(fileobj, destination_dir):
+def tar_extract(fileobj, destination_dir, parallel=None):
     """Extract tar file controlling not absolute paths and fixing the routes
-    if the tar was zipped in windows"""
+    if the tar was zipped in windows
+    :param parallel: number of threads writing the files of a gzipped tar, while it is being
+                     decompressed in background
+    """
     def badpath(path, base):
         # joinpath will ignore base if path is absolute
         return not realpath(abspath(joinpath(base, path))).startswith(base)
@@ -355,6 +450,10 @@ def tar_extract(fileobj, destination_dir):
                 finfo.name = finfo.name.replace("\\", "/")
                 yield finfo
 
+    if parallel and parallel > 1 and _is_gzip(fileobj):
+        _parallel_tar_extract(fileobj, destination_dir, safemembers, parallel)
+        return
+
     the_tar = tarfile.open(fileobj=fileobj)
     # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
     # "could not change modification time", with time=0
@@ -363,6 +462,146 @@ def tar_extract(fileobj, destination_dir):
     the_tar.close()
 
 
+def _is_gzip(fileobj):
+    position = fileobj.tell()
+    magic = fileobj.read(2)
+    fileobj.seek(position)
+    return magic == b"\x1f\x8b"
+
+
+class _BackgroundGunzip(object):
+    """ Read only file object with the decompressed contents of a gzip file object, that is
+    inflated in chunks by a background thread
+    """
+    chunk_size = 1024 * 1024
+    max_chunks = 16
+
+    def __init__(self, fileobj):
+        from conans.client.output import inherit_thread_output
+
+        self._queue = six.moves.queue.Queue(self.max_chunks)
+        self._stop = threading.Event()
+        self._buffer = b""
+        self._eof = False
+        # The progress bar reading the fileobj keeps writing to the output of the caller
+        self._thread = threading.Thread(target=inherit_thread_output(self._inflate),
+                                        args=(fileobj, ))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except six.moves.queue.Full:
+                pass
+
+    def _inflate(self, fileobj):
+        try:
+            gz = gzip.GzipFile(fileobj=fileobj, mode="rb")
+            while not self._stop.is_set():
+                chunk = gz.read(self.chunk_size)
+                self._put(chunk)
+                if not chunk:
+                    break
+        except Exception:
+            self._put(sys.exc_info())
+
+    def read(self, size=-1):
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._queue.get()
+            if isinstance(chunk, tuple):
+                six.reraise(*chunk)
+            if not chunk:
+                self._eof = True
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        result, self._buffer = self._buffer[:size], self._buffer[size:]
+        return result
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def _makedirs(path):
+    try:
+        os.makedirs(path)
+    except OSError as e:  # Other thread might have created it meanwhile
+        if e.errno != errno.EEXIST or not os.path.isdir(path):
+            raise
+
+
+def _parallel_tar_extract(fileobj, destination_dir, safemembers, parallel):
+    """ The tar stream is parsed in the current thread while it is inflated in background. The
+    contents of the regular files are written, and their modes and times applied, by a pool of
+    threads (the ownership is not changed). Big files, links and special members are extracted
+    directly by the tarfile
+    """
+    max_file_size = 16 * 1024 * 1024  # Bigger files are streamed to disk, not kept in memory
+    max_pending_size = 64 * 1024 * 1024
+
+    source = _BackgroundGunzip(fileobj)
+    the_tar = tarfile.open(fileobj=source, mode="r|")
+    pool = ThreadPool(parallel)
+    pending = deque()  # [(AsyncResult, size)]
+    pending_size = [0]
+    written = {}  # {target path: AsyncResult}, a file might be repeated in the tar
+    directories = []
+
+    def set_attrs(finfo, target):
+        # Same as extractall() with the default errorlevel, failures are just logged
+        try:
+            the_tar.chmod(finfo, target)
+            the_tar.utime(finfo, target)
+        except tarfile.ExtractError as e:
+            logger.debug("tarfile: %s" % e)
+
+    def write_file(finfo, target, contents):
+        _makedirs(os.path.dirname(target))
+        with open(target, "wb") as f:
+            f.write(contents)
+        set_attrs(finfo, target)
+
+    def wait_oldest():
+        result, size = pending.popleft()
+        result.get()
+        pending_size[0] -= size
+
+    try:
+        for finfo in safemembers(the_tar):
+            target = joinpath(destination_dir, finfo.name)
+            previous = written.pop(target, None)
+            if previous is not None:
+                previous.wait()
+            if finfo.isdir():
+                _makedirs(target)
+                directories.append((finfo, target))
+            elif finfo.isreg() and not finfo.issparse() and finfo.size <= max_file_size:
+                contents = the_tar.extractfile(finfo).read()
+                result = pool.apply_async(write_file, (finfo, target, contents))
+                written[target] = result
+                pending.append((result, finfo.size))
+                pending_size[0] += finfo.size
+                while pending_size[0] > max_pending_size:
+                    wait_oldest()
+            else:
+                _makedirs(os.path.dirname(target))
+                the_tar.extract(finfo, destination_dir)
+        while pending:
+            wait_oldest()
+        # Like extractall(), set the directories attributes at the end, innermost first
+        for finfo, target in sorted(directories, key=lambda d: d[1], reverse=True):
+            set_attrs(finfo, target)
+    finally:
+        pool.terminate()
+        pool.join()
+        source.close()
+        the_tar.close()
+
+
 def list_folder_subdirs(basedir, level):
     ret = []
     for root, dirs, _ in walk(basedir):
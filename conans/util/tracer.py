@@ -166,7 +166,10 @@ def log_download(url, duration):
 
 
 def log_uncompressed_file(src_path, duration, dest_folder):
-    _append_action("UNZIP", {"src": src_path, "dst": dest_folder, "duration": duration})
+    size = os.path.getsize(src_path) if os.path.exists(src_path) else None
+    throughput = size / duration if size is not None and duration > 0 else None
+    _append_action("UNZIP", {"src": src_path, "dst": dest_folder, "duration": duration,
+                             "size": size, "throughput": throughput})
 
 
 def log_compressed_files(files, duration, tgz_path):